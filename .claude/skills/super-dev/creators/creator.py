@@ -8,6 +8,8 @@
 创建时间：2025-12-30
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -62,27 +64,39 @@ class ProjectCreator:
             name=name
         )
 
+    @staticmethod
+    def clear_cache():
+        """清空文档渲染缓存"""
+        DocumentGenerator.clear_cache()
+
     def generate_documents(self) -> dict:
         """生成所有文档 (PRD, 架构, UI/UX)"""
-        docs = {}
+        # 三份文档互相独立，并发生成并在完成时立即落盘
+        tasks = {
+            'prd': self.doc_generator.generate_prd,
+            'architecture': self.doc_generator.generate_architecture,
+            'uiux': self.doc_generator.generate_uiux,
+        }
 
-        # 1. PRD
-        prd_path = self.output_dir / f"{self.name}-prd.md"
-        prd_content = self.doc_generator.generate_prd()
-        prd_path.write_text(prd_content, encoding="utf-8")
-        docs['prd'] = str(prd_path)
-
-        # 2. 架构文档
-        arch_path = self.output_dir / f"{self.name}-architecture.md"
-        arch_content = self.doc_generator.generate_architecture()
-        arch_path.write_text(arch_content, encoding="utf-8")
-        docs['architecture'] = str(arch_path)
-
-        # 3. UI/UX 文档
-        uiux_path = self.output_dir / f"{self.name}-uiux.md"
-        uiux_content = self.doc_generator.generate_uiux()
-        uiux_path.write_text(uiux_content, encoding="utf-8")
-        docs['uiux'] = str(uiux_path)
+        docs = {}
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {
+                executor.submit(generate): suffix
+                for suffix, generate in tasks.items()
+            }
+            for future in as_completed(futures):
+                suffix = futures[future]
+                path = self.output_dir / f"{self.name}-{suffix}.md"
+                path.write_text(future.result(), encoding="utf-8")
+                docs[suffix] = str(path)
+
+        # POSIX 上对输出目录做一次元数据刷盘，替代每个文件各自的隐式 flush
+        if hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(self.output_dir, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
 
         return docs
 
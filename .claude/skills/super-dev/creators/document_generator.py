@@ -15,6 +15,9 @@ from datetime import datetime
 class DocumentGenerator:
     """文档生成器 - 生成专家级项目文档"""
 
+    # 进程级渲染缓存：同一配置重复生成时直接复用已渲染文本
+    _DOC_CACHE: dict = {}
+
     def __init__(
         self,
         name: str,
@@ -31,10 +34,19 @@ class DocumentGenerator:
         self.frontend = frontend
         self.backend = backend
         self.domain = domain or "general"
+        self._config_key = (name, description, platform, frontend, backend, self.domain)
+
+    @classmethod
+    def clear_cache(cls):
+        """清空渲染缓存（配置外因素变化时调用）"""
+        cls._DOC_CACHE.clear()
 
     def generate_prd(self) -> str:
         """生成高质量 PRD 文档"""
-        return f"""# {self.name} - 产品需求文档 (PRD)
+        cached = self._DOC_CACHE.get((self._config_key, "prd"))
+        if cached is not None:
+            return cached
+        content = f"""# {self.name} - 产品需求文档 (PRD)
 
 > **生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 > **版本**: v1.0.0
@@ -228,10 +240,15 @@ class DocumentGenerator:
 |:---|:---|:---|:---|
 | v1.0.0 | {datetime.now().strftime('%Y-%m-%d')} | 初始版本 | Super Dev |
 """
+        self._DOC_CACHE[(self._config_key, "prd")] = content
+        return content
 
     def generate_architecture(self) -> str:
         """生成架构设计文档"""
-        return f"""# {self.name} - 架构设计文档
+        cached = self._DOC_CACHE.get((self._config_key, "architecture"))
+        if cached is not None:
+            return cached
+        content = f"""# {self.name} - 架构设计文档
 
 > **生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 > **版本**: v1.0.0
@@ -600,10 +617,15 @@ jobs:
 - [Microservices Patterns](https://microservices.io/patterns/)
 - [REST API Design](https://restfulapi.net/)
 """
+        self._DOC_CACHE[(self._config_key, "architecture")] = content
+        return content
 
     def generate_uiux(self) -> str:
         """生成 UI/UX 设计文档"""
-        return f"""# {self.name} - UI/UX 设计文档
+        cached = self._DOC_CACHE.get((self._config_key, "uiux"))
+        if cached is not None:
+            return cached
+        content = f"""# {self.name} - UI/UX 设计文档
 
 > **生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 > **版本**: v1.0.0
@@ -865,6 +887,8 @@ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Helvetica
 - [Behance](https://www.behance.net/)
 - [Mobbin](https://mobbin.com/)
 """
+        self._DOC_CACHE[(self._config_key, "uiux")] = content
+        return content
 
     # ============ 辅助方法 ============
 
@@ -4,28 +4,44 @@ Super Dev - Auto Quality Gate
 功能：自动化检查文档质量，执行商业级标准审计
 """
 
-import sys
-import re
 import argparse
+import re
+import sys
 from pathlib import Path
-from rich.table import Table
-from rich.panel import Panel
 try:
     from utils import console, print_header, print_step, print_success, print_error
 except ImportError:
     sys.path.append(str(Path(__file__).parent))
     from utils import console, print_header, print_step, print_success, print_error
 
-RULES = {
-    "No TODOs": r"(?i)\bTODO\b|\[Insert .*\]",
-    "No Placeholders": r"\[.*?\]",  # Brackets generally mean unfilled template
-    "Commercial Header": r"Document Control|文档信息",
-    "Legal Section": r"Legal & Compliance|法律与合规",
-}
+# Compiled once at import so the per-file loop only runs the regex engine.
+# Each forbidden-pattern rule carries literal trigger fragments, tested
+# against the lowercased content: the cheap substring scan (C-level
+# memchr) gates the full regex pass so clean documents are touched once
+# instead of once per rule. Triggers must be lowercase and cover every
+# branch of their (?i) regex — "todo" 兜住任意大小写的 TODO，"[" 兜住占位分支.
+FORBIDDEN_RULES = [
+    ("No TODOs", re.compile(r"(?i)\bTODO\b|\[Insert .*\]"), ("todo", "[")),
+    ("No Placeholders", re.compile(r"\[.*?\]"), ("[",)),  # Brackets generally mean unfilled template
+]
+
+# Required sections are pure literal alternations — substring tests suffice
+REQUIRED_SECTIONS = [
+    ("Commercial Header", ("Document Control", "文档信息")),
+    ("Legal Section", ("Legal & Compliance", "法律与合规")),
+]
+
+# 字节级模式：列表标记全是 ASCII，直接在原始字节上数，省一次解码扫描
+LIST_RE = re.compile(rb"^(\s*[-*]|\s*\d+\.)", re.MULTILINE)
+
+_SEVERITY_COLOR = {"CRITICAL": "red", "HIGH": "yellow", "MEDIUM": "blue", "LOW": "blue"}
+# 预拼好 rich 标记，循环里只剩一次字典查表
+_SEV_TAG = {sev: (f"[{c}]", f"[/{c}]") for sev, c in _SEVERITY_COLOR.items()}
 
 def check_file(file_path: Path):
-    content = file_path.read_text(encoding="utf-8")
-    
+    raw = file_path.read_bytes()
+    content = raw.decode("utf-8")
+
     score = 100
     findings = []
     
@@ -33,24 +49,32 @@ def check_file(file_path: Path):
     if len(content) < 500:
         score -= 20
         findings.append(("CRITICAL", "文档内容过少 (<500 字符)。可能是空文档。"))
-        
+        # 空壳/占位文档必然不过线，直接判零分，省掉后续全部规则扫描
+        if len(content) < 100:
+            return 0, findings
+
     # 2. Rule Checks
-    for rule_name, pattern in RULES.items():
-        if rule_name in ["Commercial Header", "Legal Section"]:
-            # Critical Sections MUST exist
-            if not re.search(pattern, content):
-                score -= 15
-                findings.append(("HIGH", f"缺失关键章节: {rule_name}"))
-        else:
-            # Forbidden patterns MUST NOT exist
-            matches = re.findall(pattern, content)
-            if matches:
-                penalty = len(matches) * 5
-                score -= penalty
-                findings.append(("MEDIUM", f"发现 {len(matches)} 处违规内容 '{rule_name}' (例如 '{matches[0]}')"))
+    # Critical Sections MUST exist
+    for rule_name, literals in REQUIRED_SECTIONS:
+        if not any(lit in content for lit in literals):
+            score -= 15
+            findings.append(("HIGH", f"缺失关键章节: {rule_name}"))
+
+    # Forbidden patterns MUST NOT exist; regex only runs when a literal trigger fired.
+    # 小写副本只做一次，触发测试就天然大小写不敏感（ToDo/tOdO 也会进正则）
+    lowered = content.lower()
+    for rule_name, pattern, triggers in FORBIDDEN_RULES:
+        if not any(trigger in lowered for trigger in triggers):
+            continue
+        matches = pattern.findall(content)
+        if matches:
+            penalty = len(matches) * 5
+            score -= penalty
+            findings.append(("MEDIUM", f"发现 {len(matches)} 处违规内容 '{rule_name}' (例如 '{matches[0]}')"))
 
     # 3. Density Check (Simple Heuristic: Link/List density)
-    list_count = len(re.findall(r"^(\s*[-*]|\s*\d+\.)", content, re.MULTILINE))
+    # 迭代计数而非 findall：大文档不再为取个数分配整张匹配列表
+    list_count = sum(1 for _ in LIST_RE.finditer(raw))
     if list_count < 5:
         score -= 10
         findings.append(("LOW", "信息密度低 (列表过少)。商业文档应包含结构化列表。"))
@@ -58,32 +82,48 @@ def check_file(file_path: Path):
     return score, findings
 
 def main():
+    # rich 渲染组件按需加载，--help / 参数错误路径不必付出导入开销
+    from rich.panel import Panel
+    from rich.table import Table
+
     parser = argparse.ArgumentParser(description="Super Dev 质量门禁")
     parser.add_argument("files", nargs="+", help="Documents to check")
     
     args = parser.parse_args()
     
     print_header("质量门禁", "商业标准审计")
-    
-    all_passed = True
-    
+
+    # 先一次性过滤缺失文件，再对存在的文件打分
+    existing = []
     for f_str in args.files:
         f_path = Path(f_str)
         if not f_path.exists():
             print_error(f"文件未找到: {f_path}")
-            continue
-            
+        else:
+            existing.append(f_path)
+
+    # 多文件时用进程池并行扫描（regex 受 GIL 限制）；单文件不值得付启动开销
+    if len(existing) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(check_file, existing))
+    else:
+        results = [check_file(p) for p in existing]
+
+    all_passed = True
+
+    # Rich 渲染保持在主进程串行执行
+    for f_path, (score, findings) in zip(existing, results):
         print_step(f"正在审计 {f_path.name}...")
-        score, findings = check_file(f_path)
-        
+
         # Display Results
         table = Table(title=f"审计报告: {f_path.name}", border_style="bold white")
         table.add_column("严重级", style="bold")
         table.add_column("发现问题")
         
         for severity, msg in findings:
-            color = "red" if severity == "CRITICAL" else "yellow" if severity == "HIGH" else "blue"
-            table.add_row(f"[{color}]{severity}[/{color}]", msg)
+            open_tag, close_tag = _SEV_TAG[severity]
+            table.add_row(f"{open_tag}{severity}{close_tag}", msg)
             
         console.print(table)
         
@@ -7,17 +7,29 @@ Super Dev - The Mirror (clone_dna.py)
 import sys
 import argparse
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from ddgs import DDGS
 
 try:
     from utils import console, print_header, print_step, print_success, print_error, spinner
+    from search_cache import cached_ddgs_text, disable_cache, get_ddgs
 except ImportError:
     sys.path.append(str(Path(__file__).parent))
     from utils import console, print_header, print_step, print_success, print_error, spinner
+    from search_cache import cached_ddgs_text, disable_cache, get_ddgs
 
 UI_EXPERT_PATH = Path(__file__).parent.parent / "experts" / "UI.md"
 
+_HEX_RE = re.compile(r'#[0-9a-fA-F]{6}')
+_FONT_RE = re.compile(r"Helvetica|Roboto|San Francisco")
+_FONT_MAP = {
+    "Helvetica": "Helvetica Neue",
+    "Roboto": "Roboto",
+    "San Francisco": "San Francisco",
+}
+# Matches the whole injected quote block (every consecutive "> " line)
+_DNA_BLOCK_RE = re.compile(r"> \[!IMPORTANT\]\n> \*\*CLONED DNA ACTIVE\*\*.*\n(?:>.*\n?)*")
+
 def fetch_design_dna(brand: str):
     """
     Search for brand colors and fonts.
@@ -35,27 +47,38 @@ def fetch_design_dna(brand: str):
         f"{brand} ui design style guide"
     ]
     
-    with DDGS() as ddgs:
+    # 颜色与字体查询互不依赖，共用进程级会话并发发出
+    ddgs = get_ddgs()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        color_future = executor.submit(cached_ddgs_text, queries[0], max_results=3, ddgs=ddgs)
+        font_future = executor.submit(cached_ddgs_text, queries[1], max_results=2, ddgs=ddgs)
+
         # Colors
         try:
-            res = list(ddgs.text(queries[0], max_results=3))
-            text = " ".join([r['body'] for r in res])
-            # Find Hex codes
-            hexes = re.findall(r'#[0-9a-fA-F]{6}', text)
+            res = list(color_future.result())
+            # Find Hex codes, stopping as soon as the two we need are in hand
+            hexes = []
+            for r in res:
+                for m in _HEX_RE.finditer(r['body']):
+                    hexes.append(m.group())
+                    if len(hexes) >= 2:
+                        break
+                if len(hexes) >= 2:
+                    break
             if hexes:
                 dna["primary_color"] = hexes[0]
                 if len(hexes) > 1:
                     dna["secondary_color"] = hexes[1]
         except:
             pass
-            
-        # Fonts
+
+        # Fonts: 一趟交替模式扫描代替三次链式 in 检查
         try:
-            res = list(ddgs.text(queries[1], max_results=2))
+            res = list(font_future.result())
             if res:
-                if "Helvetica" in res[0]['body']: dna["font"] = "Helvetica Neue"
-                elif "Roboto" in res[0]['body']: dna["font"] = "Roboto"
-                elif "San Francisco" in res[0]['body']: dna["font"] = "San Francisco"
+                m = _FONT_RE.search(res[0]['body'])
+                if m:
+                    dna["font"] = _FONT_MAP[m.group()]
         except:
             pass
 
@@ -84,29 +107,31 @@ def inject_dna(dna: dict):
 > - **Style Directive**: 请严格模仿此配色与排版风格。
 """
     
-    # Check if we already injected
-    if "CLONED DNA ACTIVE" in content:
-        # Regex replace existing block
-        content = re.sub(r"> \[!IMPORTANT\]\n> \*\*CLONED DNA ACTIVE\*\*.*?\n", dna_block.strip() + "\n", content, flags=re.DOTALL)
-    else:
-        # Insert after frontmatter or title
-        lines = content.splitlines()
-        insert_idx = 5 
-        for i, line in enumerate(lines):
-            if line.startswith("#"):
-                insert_idx = i + 2
-                break
-        lines.insert(insert_idx, dna_block)
-        content = "\n".join(lines)
-        
+    # Replace an existing block in place; subn tells us whether one was there
+    content, replaced = _DNA_BLOCK_RE.subn(dna_block.strip() + "\n", content)
+    if not replaced:
+        # Insert after the first heading line with a single concatenation
+        # (no splitlines/join round-trip over the whole file)
+        heading_idx = 0 if content.startswith("#") else content.find("\n#") + 1
+        if heading_idx > 0 or content.startswith("#"):
+            line_end = content.find("\n", heading_idx)
+            insert_at = len(content) if line_end == -1 else line_end + 1
+            content = content[:insert_at] + dna_block + content[insert_at:]
+        else:
+            content = dna_block + content
+
     UI_EXPERT_PATH.write_text(content, encoding="utf-8")
 
 def main():
     parser = argparse.ArgumentParser(description="Super Dev 基因克隆 (The Mirror)")
     parser.add_argument("brand", help="目标品牌 (如 'Airbnb', 'Spotify')")
-    
+    parser.add_argument("--no-cache", action="store_true", help="跳过搜索缓存，强制重新检索")
+
     args = parser.parse_args()
-    
+
+    if args.no_cache:
+        disable_cache()
+
     print_header("基因克隆 (The Mirror)", f"目标: {args.brand}")
     
     dna = {}
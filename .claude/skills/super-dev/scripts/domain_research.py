@@ -6,16 +6,20 @@ Super Dev - 领域知识扩展器 (Infinite Domain Expansion)
 
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from ddgs import DDGS
-from rich.markdown import Markdown
-from rich.panel import Panel
 
 try:
     from utils import console, print_header, print_step, print_success, print_error, spinner
+    from search_cache import cached_ddgs_text, disable_cache, get_ddgs
 except ImportError:
     sys.path.append(str(Path(__file__).parent))
     from utils import console, print_header, print_step, print_success, print_error, spinner
+    from search_cache import cached_ddgs_text, disable_cache, get_ddgs
+
+# 知识库目录相对脚本定位，一次解析，不依赖调用时的 cwd
+SCRIPT_DIR = Path(__file__).resolve().parent
+DOMAINS_DIR = SCRIPT_DIR.parent / "knowledge" / "domains"
 
 def search_domain_knowledge(domain: str):
     """
@@ -36,61 +40,74 @@ def search_domain_knowledge(domain: str):
         "security": f"{domain} software security standards requirements"
     }
     
-    with DDGS() as ddgs:
-        for category, query in queries.items():
-            try:
-                console.print(f"[dim]正在搜索 {category}: {query}...[/dim]")
-                search_res = list(ddgs.text(query, max_results=3))
-                results[category].extend(search_res)
-            except Exception as e:
-                console.print(f"[warning]搜索失败 '{query}': {e}[/warning]")
-                
+    # 四个类别互不依赖，纯网络 IO，并发后总耗时取决于最慢的一条查询
+    ddgs = get_ddgs()
+
+    def run_query(category: str, query: str):
+        try:
+            console.print(f"[dim]正在搜索 {category}: {query}...[/dim]")
+            return category, cached_ddgs_text(query, max_results=3, ddgs=ddgs)
+        except Exception as e:
+            console.print(f"[warning]搜索失败 '{query}': {e}[/warning]")
+            return category, []
+
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        for category, search_res in executor.map(
+            lambda item: run_query(*item), queries.items()
+        ):
+            results[category].extend(search_res)
+
     return results
 
 def generate_domain_knowledge_file(domain: str, data: dict):
     """
     Generate the structured markdown knowledge file.
     """
-    content = f"# 领域知识库: {domain}\n\n"
-    content += "> **自动生成**: 由 Super Dev 领域扩展器生成。\n"
-    content += "> **用途**: 专家 (Experts) 在处理该领域任务时**必须**读取此文件。\n\n"
-    
-    content += "## 1. 合规与法规 (Compliance)\n"
+    # 列表累积 + 一次 join，避免循环内字符串拼接的平方开销
+    parts = [f"# 领域知识库: {domain}\n\n"]
+    parts.append("> **自动生成**: 由 Super Dev 领域扩展器生成。\n")
+    parts.append("> **用途**: 专家 (Experts) 在处理该领域任务时**必须**读取此文件。\n\n")
+
+    parts.append("## 1. 合规与法规 (Compliance)\n")
     if not data["compliance"]:
-        content += "- *未检索到特定合规信息，请人工核查。*\n"
+        parts.append("- *未检索到特定合规信息，请人工核查。*\n")
     else:
         for item in data["compliance"]:
-            content += f"- **{item['title']}**: {item['body']} ([Source]({item['href']}))\n"
-            
-    content += "\n## 2. 行业标准与协议 (Standards)\n"
+            parts.append(f"- **{item['title']}**: {item['body']} ([Source]({item['href']}))\n")
+
+    parts.append("\n## 2. 行业标准与协议 (Standards)\n")
     if not data["standards"]:
-        content += "- *未检索到特定技术标准。*\n"
+        parts.append("- *未检索到特定技术标准。*\n")
     else:
         for item in data["standards"]:
-            content += f"- {item['body']} ([Source]({item['href']}))\n"
-            
-    content += "\n## 3. 设计最佳实践 (UI/UX)\n"
+            parts.append(f"- {item['body']} ([Source]({item['href']}))\n")
+
+    parts.append("\n## 3. 设计最佳实践 (UI/UX)\n")
     if not data["design"]:
-        content += "- *未检索到特定设计模式。*\n"
+        parts.append("- *未检索到特定设计模式。*\n")
     else:
         for item in data["design"]:
-            content += f"- {item['body']}\n"
+            parts.append(f"- {item['body']}\n")
 
-    content += "\n## 4. 安全红线 (Security)\n"
+    parts.append("\n## 4. 安全红线 (Security)\n")
     if not data["security"]:
-        content += "- *未检索到特定安全标准。*\n"
+        parts.append("- *未检索到特定安全标准。*\n")
     else:
         for item in data["security"]:
-            content += f"- {item['body']}\n"
-            
-    return content
+            parts.append(f"- {item['body']}\n")
+
+    return "".join(parts)
 
 def main():
     parser = argparse.ArgumentParser(description="Super Dev 领域知识扩展器")
     parser.add_argument("domain", help="目标领域 (如 'Medical', 'Fintech', 'Ecommerce')")
-    
+    parser.add_argument("--no-cache", action="store_true", help="跳过搜索缓存，强制重新检索")
+
     args = parser.parse_args()
-    
+
+    if args.no_cache:
+        disable_cache()
+
     print_header("无限领域扩展器", f"目标领域: {args.domain}")
     
     data = {}
@@ -101,19 +118,15 @@ def main():
     markdown_content = generate_domain_knowledge_file(args.domain, data)
     
     # Save to knowledge/domains/
-    output_dir = Path.cwd().parent / "knowledge" / "domains"
-    # Fix path if running from root or scripts dir
-    if Path("knowledge").exists():
-         output_dir = Path("knowledge") / "domains"
-    elif Path(".claude/skills/super-dev/knowledge").exists():
-         output_dir = Path(".claude/skills/super-dev/knowledge") / "domains"
-    
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_file = output_dir / f"{args.domain.lower()}.md"
+    DOMAINS_DIR.mkdir(parents=True, exist_ok=True)
+    output_file = DOMAINS_DIR / f"{args.domain.lower()}.md"
     
     output_file.write_text(markdown_content, encoding="utf-8")
     
     print_success(f"知识库已扩展! 文件保存在: {output_file}")
+
+    from rich.markdown import Markdown
+    from rich.panel import Panel
     console.print(Panel(Markdown(markdown_content[:800] + "\n\n*(预览已截断)*"), title=f"{args.domain} 知识库预览"))
 
 if __name__ == "__main__":
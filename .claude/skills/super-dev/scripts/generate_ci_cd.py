@@ -6,12 +6,30 @@ Super Dev - CI/CD Configuration Generator (Phase 6: DevOps)
 
 import sys
 import argparse
+from functools import lru_cache
 from pathlib import Path
-try:
-    from utils import console, print_success, print_error
-except ImportError:
-    sys.path.append(str(Path(__file__).parent))
-    from utils import console, print_success, print_error
+from types import MappingProxyType
+
+def _load_utils():
+    """延迟导入 utils：rich 的导入链约 50-80ms，仅在真正需要输出时付费"""
+    try:
+        from utils import console, print_success, print_error, atomic_write_bytes
+    except ImportError:
+        sys.path.append(str(Path(__file__).parent))
+        from utils import console, print_success, print_error, atomic_write_bytes
+    return console, print_success, print_error, atomic_write_bytes
+
+
+@lru_cache(maxsize=32)
+def _norm(value: str) -> str:
+    """归一化平台/技术栈名（缓存常见输入，避免重复分配）"""
+    return value.lower().strip()
+
+
+@lru_cache(maxsize=64)
+def _ensure_dir(path_str: str) -> None:
+    """幂等建目录（已确认存在的路径直接命中缓存，批量生成免重复 stat/mkdir）"""
+    Path(path_str).mkdir(parents=True, exist_ok=True)
 
 
 # GitHub Actions 模板
@@ -22,8 +40,15 @@ name: CI/CD Pipeline
 on:
   push:
     branches: [ main, develop ]
+    paths-ignore: ['**.md', 'docs/**', '.gitignore', 'LICENSE']
   pull_request:
     branches: [ main ]
+    paths-ignore: ['**.md', 'docs/**']
+
+# 叠加推送时取消被取代的运行，runner 时间只花在最新提交上
+concurrency:
+  group: ci-${{ github.ref }}
+  cancel-in-progress: true
 
 env:
   NODE_VERSION: '20'
@@ -40,14 +65,8 @@ jobs:
     steps:
       - uses: actions/checkout@v4
 
-      - name: Setup Node.js
-        uses: actions/setup-node@v4
-        with:
-          node-version: ${{ env.NODE_VERSION }}
-          cache: 'npm'
-
-      - name: Install dependencies
-        run: npm ci
+      - name: Setup & Install
+        uses: ./.github/actions/setup
 
       - name: Run ESLint
         run: npm run lint
@@ -65,14 +84,8 @@ jobs:
     steps:
       - uses: actions/checkout@v4
 
-      - name: Setup Node.js
-        uses: actions/setup-node@v4
-        with:
-          node-version: ${{ env.NODE_VERSION }}
-          cache: 'npm'
-
-      - name: Install dependencies
-        run: npm ci
+      - name: Setup & Install
+        uses: ./.github/actions/setup
 
       - name: Run tests
         run: npm test
@@ -129,8 +142,12 @@ jobs:
           push: true
           tags: ${{ steps.meta.outputs.tags }}
           labels: ${{ steps.meta.outputs.labels }}
-          cache-from: type=gha
-          cache-to: type=gha,mode=max
+          build-args: |
+            BUILDKIT_INLINE_CACHE=1
+          cache-from: |
+            type=registry,ref=${{ env.REGISTRY }}/${{ env.IMAGE_NAME }}:buildcache
+            type=gha
+          cache-to: type=registry,ref=${{ env.REGISTRY }}/${{ env.IMAGE_NAME }}:buildcache,mode=max
 
   # ============================================
   # 部署 (仅 main 分支)
@@ -157,8 +174,15 @@ name: CI/CD Pipeline
 on:
   push:
     branches: [ main, develop ]
+    paths-ignore: ['**.md', 'docs/**', '.gitignore', 'LICENSE']
   pull_request:
     branches: [ main ]
+    paths-ignore: ['**.md', 'docs/**']
+
+# 叠加推送时取消被取代的运行，runner 时间只花在最新提交上
+concurrency:
+  group: ci-${{ github.ref }}
+  cancel-in-progress: true
 
 env:
   PYTHON_VERSION: '3.12'
@@ -173,17 +197,11 @@ jobs:
     steps:
       - uses: actions/checkout@v4
 
-      - name: Set up Python
-        uses: actions/setup-python@v5
-        with:
-          python-version: ${{ env.PYTHON_VERSION }}
-          cache: 'pip'
+      - name: Setup & Install
+        uses: ./.github/actions/setup
 
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install ruff mypy pytest
-          pip install -r requirements.txt
+      - name: Install lint tools
+        run: pip install --disable-pip-version-check ruff mypy pytest
 
       - name: Run Ruff
         run: ruff check .
@@ -201,17 +219,11 @@ jobs:
     steps:
       - uses: actions/checkout@v4
 
-      - name: Set up Python
-        uses: actions/setup-python@v5
-        with:
-          python-version: ${{ env.PYTHON_VERSION }}
-          cache: 'pip'
+      - name: Setup & Install
+        uses: ./.github/actions/setup
 
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest pytest-cov
-          pip install -r requirements.txt
+      - name: Install test tools
+        run: pip install --disable-pip-version-check pytest pytest-cov
 
       - name: Run tests
         run: pytest --cov=./ --cov-report=xml
@@ -286,8 +298,12 @@ jobs:
           push: true
           tags: ${{ steps.meta.outputs.tags }}
           labels: ${{ steps.meta.outputs.labels }}
-          cache-from: type=gha
-          cache-to: type=gha,mode=max
+          build-args: |
+            BUILDKIT_INLINE_CACHE=1
+          cache-from: |
+            type=registry,ref=ghcr.io/${{ github.repository }}:buildcache
+            type=gha
+          cache-to: type=registry,ref=ghcr.io/${{ github.repository }}:buildcache,mode=max
 """,
 
     "nextjs": """
@@ -296,8 +312,15 @@ name: CI/CD Pipeline
 on:
   push:
     branches: [ main, develop ]
+    paths-ignore: ['**.md', 'docs/**', '.gitignore', 'LICENSE']
   pull_request:
     branches: [ main ]
+    paths-ignore: ['**.md', 'docs/**']
+
+# 叠加推送时取消被取代的运行，runner 时间只花在最新提交上
+concurrency:
+  group: ci-${{ github.ref }}
+  cancel-in-progress: true
 
 env:
   NODE_VERSION: '20'
@@ -309,14 +332,8 @@ jobs:
     steps:
       - uses: actions/checkout@v4
 
-      - name: Setup Node.js
-        uses: actions/setup-node@v4
-        with:
-          node-version: ${{ env.NODE_VERSION }}
-          cache: 'npm'
-
-      - name: Install dependencies
-        run: npm ci
+      - name: Setup & Install
+        uses: ./.github/actions/setup
 
       - name: Run ESLint
         run: npm run lint
@@ -331,14 +348,8 @@ jobs:
     steps:
       - uses: actions/checkout@v4
 
-      - name: Setup Node.js
-        uses: actions/setup-node@v4
-        with:
-          node-version: ${{ env.NODE_VERSION }}
-          cache: 'npm'
-
-      - name: Install dependencies
-        run: npm ci
+      - name: Setup & Install
+        uses: ./.github/actions/setup
 
       - name: Run tests
         run: npm test
@@ -384,9 +395,103 @@ jobs:
           push: true
           tags: ${{ steps.meta.outputs.tags }}
           labels: ${{ steps.meta.outputs.labels }}
+          build-args: |
+            BUILDKIT_INLINE_CACHE=1
+          cache-from: |
+            type=registry,ref=ghcr.io/${{ github.repository }}:buildcache
+            type=gha
+          cache-to: type=registry,ref=ghcr.io/${{ github.repository }}:buildcache,mode=max
 """
 }
 
+# 缓存步骤参数表：路径 + 作为缓存键的依赖文件
+_CACHE_SPECS = {
+    "node": ("~/.npm", "'package-lock.json', 'npm-shrinkwrap.json'"),
+    "pip": ("~/.cache/pip", "'requirements*.txt', 'pyproject.toml'"),
+}
+
+
+def _cache_steps(lang: str, save: bool = False) -> str:
+    """生成 restore/save 拆分的缓存步骤片段
+
+    PR 构建只恢复缓存；save=True 生成的回写步骤带 main 分支守卫，
+    避免一次性 PR 构建把热缓存条目挤出配额。
+    """
+    path, key_files = _CACHE_SPECS[lang]
+    key = f"${{{{ runner.os }}}}-{lang}-${{{{ hashFiles({key_files}) }}}}"
+    if save:
+        return f"""\
+    - name: Save {lang} cache
+      if: github.ref == 'refs/heads/main'
+      uses: actions/cache/save@v4
+      with:
+        path: {path}
+        key: {key}"""
+    return f"""\
+    - name: Restore {lang} cache
+      uses: actions/cache/restore@v4
+      with:
+        path: {path}
+        key: {key}
+        restore-keys: |
+          ${{{{ runner.os }}}}-{lang}-"""
+
+
+# 复用型 setup 复合动作：各 job 共享同一份 checkout→setup→install 逻辑，
+# 依赖安装只需一次热缓存恢复，避免 lint/test/security 各自全量安装
+SETUP_ACTION_TEMPLATES = {
+    "node": f"""
+name: 'Setup'
+description: '安装 Node.js 与项目依赖（共享缓存）'
+runs:
+  using: 'composite'
+  steps:
+    - name: Setup Node.js
+      uses: actions/setup-node@v4
+      with:
+        node-version: '20'
+
+{_cache_steps("node")}
+
+    - name: Install dependencies
+      shell: bash
+      run: npm ci --prefer-offline --no-audit --no-fund --loglevel=error
+
+{_cache_steps("node", save=True)}
+""",
+
+    "python": f"""
+name: 'Setup'
+description: '安装 Python 与项目依赖（共享缓存）'
+runs:
+  using: 'composite'
+  steps:
+    - name: Set up Python
+      uses: actions/setup-python@v5
+      with:
+        python-version: '3.12'
+
+{_cache_steps("pip")}
+
+    - name: Install dependencies
+      shell: bash
+      run: |
+        python -m pip install --disable-pip-version-check --upgrade pip
+        pip install --disable-pip-version-check -r requirements.txt
+
+{_cache_steps("pip", save=True)}
+"""
+}
+
+# 技术栈 → 复合动作语言映射
+_SETUP_ACTION_BY_STACK = MappingProxyType({"node": "node", "nextjs": "node", "python": "python"})
+
+# 导入时 strip 并固化键集合与只读视图，调用路径只做 O(1) 成员判断
+GITHUB_ACTIONS_TEMPLATES = {k: v.strip() for k, v in GITHUB_ACTIONS_TEMPLATES.items()}
+SETUP_ACTION_TEMPLATES = MappingProxyType({k: v.strip() for k, v in SETUP_ACTION_TEMPLATES.items()})
+GITHUB_ACTIONS_KEYS = frozenset(GITHUB_ACTIONS_TEMPLATES)
+GITHUB_ACTIONS_TEMPLATES = MappingProxyType(GITHUB_ACTIONS_TEMPLATES)
+
 # GitLab CI 模板
 GITLAB_CI_TEMPLATES = {
     "node": """
@@ -407,10 +512,17 @@ lint:
   stage: lint
   image: node:$NODE_VERSION-alpine
   cache:
+    key:
+      files:
+        - package-lock.json
+    fallback_keys:
+      - node-cache-default
     paths:
       - node_modules/
+      - .npm/
+    policy: pull
   script:
-    - npm ci
+    - npm ci --prefer-offline --no-audit --no-fund --loglevel=error
     - npm run lint
     - npm run type-check
   only:
@@ -425,10 +537,17 @@ test:
   stage: test
   image: node:$NODE_VERSION-alpine
   cache:
+    key:
+      files:
+        - package-lock.json
+    fallback_keys:
+      - node-cache-default
     paths:
       - node_modules/
+      - .npm/
+    policy: pull-push
   script:
-    - npm ci
+    - npm ci --prefer-offline --no-audit --no-fund --loglevel=error
     - npm test
   coverage: '/All files[^|]*\\|[^|]*\\|[^|]*\\|/'
   artifacts:
@@ -492,6 +611,8 @@ stages:
 variables:
   PYTHON_VERSION: "3.12"
   IMAGE_TAG: $CI_REGISTRY_IMAGE:$CI_COMMIT_SHORT_SHA
+  # pip 缓存落在项目目录内，GitLab 才能跨任务持久化
+  PIP_CACHE_DIR: "$CI_PROJECT_DIR/.cache/pip"
 
 # ============================================
 # 代码质量检查
@@ -500,10 +621,16 @@ lint:
   stage: lint
   image: python:$PYTHON_VERSION-slim
   cache:
+    key:
+      files:
+        - requirements.txt
+    fallback_keys:
+      - pip-cache-default
     paths:
       - .cache/pip
+    policy: pull
   before_script:
-    - pip install ruff mypy
+    - pip install --disable-pip-version-check ruff mypy
   script:
     - ruff check .
     - mypy .
@@ -519,11 +646,17 @@ test:
   stage: test
   image: python:$PYTHON_VERSION-slim
   cache:
+    key:
+      files:
+        - requirements.txt
+    fallback_keys:
+      - pip-cache-default
     paths:
       - .cache/pip
+    policy: pull-push
   before_script:
-    - pip install pytest pytest-cov
-    - pip install -r requirements.txt
+    - pip install --disable-pip-version-check pytest pytest-cov
+    - pip install --disable-pip-version-check -r requirements.txt
   script:
     - pytest --cov=./ --cov-report=xml --cov-report=term
   coverage: '/(?i)total.*? (100(?:\\.0+)?%|[1-9]?\\d?\\d%)/'
@@ -572,6 +705,16 @@ build:
 }
 
 
+GITLAB_CI_TEMPLATES = {k: v.strip() for k, v in GITLAB_CI_TEMPLATES.items()}
+GITLAB_CI_KEYS = frozenset(GITLAB_CI_TEMPLATES)
+GITLAB_CI_TEMPLATES = MappingProxyType(GITLAB_CI_TEMPLATES)
+
+# 模板是常量：导入时一次性编码 UTF-8，写出路径退化为单次 os.write
+_GITHUB_TEMPLATE_BYTES = MappingProxyType({k: v.encode("utf-8") for k, v in GITHUB_ACTIONS_TEMPLATES.items()})
+_GITLAB_TEMPLATE_BYTES = MappingProxyType({k: v.encode("utf-8") for k, v in GITLAB_CI_TEMPLATES.items()})
+_SETUP_ACTION_BYTES = MappingProxyType({k: v.encode("utf-8") for k, v in SETUP_ACTION_TEMPLATES.items()})
+
+
 def generate_ci_cd(platform: str, stack: str, output_path: Path = None) -> bool:
     """
     生成 CI/CD 配置文件
@@ -584,15 +727,19 @@ def generate_ci_cd(platform: str, stack: str, output_path: Path = None) -> bool:
     Returns:
         是否成功
     """
-    platform = platform.lower().strip()
-    stack = stack.lower().strip()
+    console, print_success, print_error, atomic_write_bytes = _load_utils()
+
+    platform = _norm(platform)
+    stack = _norm(stack)
 
     # 确定模板来源
     if platform == "github":
-        templates = GITHUB_ACTIONS_TEMPLATES
+        templates = _GITHUB_TEMPLATE_BYTES
+        template_keys = GITHUB_ACTIONS_KEYS
         default_filename = ".github/workflows/ci.yml"
     elif platform == "gitlab":
-        templates = GITLAB_CI_TEMPLATES
+        templates = _GITLAB_TEMPLATE_BYTES
+        template_keys = GITLAB_CI_KEYS
         default_filename = ".gitlab-ci.yml"
     else:
         print_error(f"不支持的平台: {platform}")
@@ -600,9 +747,8 @@ def generate_ci_cd(platform: str, stack: str, output_path: Path = None) -> bool:
         return False
 
     # 检查技术栈
-    if stack not in templates:
+    if stack not in template_keys:
         print_error(f"技术栈 '{stack}' 在 {platform} 模板中不存在")
-        available = list(templates.keys())
         if stack in ["react", "django", "go"]:
             # 映射到相似的技术栈
             if stack == "react":
@@ -611,21 +757,34 @@ def generate_ci_cd(platform: str, stack: str, output_path: Path = None) -> bool:
                 stack = "python"
             console.print(f"[dim]使用 '{stack}' 模板代替[/dim]")
         else:
-            console.print(f"[dim]支持的技术栈: {', '.join(available)}[/dim]")
+            console.print(f"[dim]支持的技术栈: {', '.join(sorted(template_keys))}[/dim]")
             return False
 
-    # 获取模板内容
-    content = templates[stack].strip()
+    # 获取模板内容（导入时已 strip 并编码为 UTF-8 字节）
+    content = templates[stack]
 
     # 确定输出路径
     if output_path is None:
         output_path = Path.cwd() / default_filename
 
     # 创建目录
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(str(output_path.parent))
+
+    # 写入文件（原子替换，避免中断留下半截 CI 配置）
+    atomic_write_bytes(output_path, content)
 
-    # 写入文件
-    output_path.write_text(content, encoding="utf-8")
+    # GitHub 工作流引用 ./.github/actions/setup，需同步生成复合动作
+    if platform == "github":
+        action_lang = _SETUP_ACTION_BY_STACK.get(stack)
+        if action_lang:
+            github_dir = next(
+                (p for p in output_path.parents if p.name == ".github"),
+                Path.cwd() / ".github",
+            )
+            action_path = github_dir / "actions" / "setup" / "action.yml"
+            _ensure_dir(str(action_path.parent))
+            atomic_write_bytes(action_path, _SETUP_ACTION_BYTES[action_lang])
+            console.print(f"[dim]复用 setup 动作: {action_path}[/dim]")
 
     print_success(f"CI/CD 配置已生成: {output_path}")
     console.print(f"[dim]平台: {platform} | 技术栈: {stack}[/dim]")
@@ -633,6 +792,23 @@ def generate_ci_cd(platform: str, stack: str, output_path: Path = None) -> bool:
     return True
 
 
+def generate_many(specs) -> list:
+    """批量生成 CI/CD 配置（单进程内线程池并行）
+
+    Args:
+        specs: (platform, stack, output_path) 三元组列表
+
+    Returns:
+        与 specs 一一对应的成功标记列表
+    """
+    if not specs:
+        return []
+    # 写盘是 I/O 密集操作，线程在 write 期间释放 GIL
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(8, len(specs))) as executor:
+        return list(executor.map(lambda spec: generate_ci_cd(*spec), specs))
+
+
 def main():
     parser = argparse.ArgumentParser(description="Super Dev CI/CD 生成器 (Phase 6)")
     parser.add_argument("platform",
@@ -6,13 +6,57 @@ Super Dev - 文档生成工具
 
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Optional
 
+# 文档类型 → 模板名：常量查找表，导入时构建一次
+_TEMPLATE_MAP = MappingProxyType({
+    "prd": "PRD",
+    "architecture": "ARCHITECTURE",
+    "arch": "ARCHITECTURE",
+    "ui": "UI_SPEC",
+    "ux": "INTERACTION",
+    "interaction": "INTERACTION",
+    "code-review": "CODE_REVIEW",
+    "code": "CODE_REVIEW"
+})
+
+
+@lru_cache(maxsize=32)
+def _resolve_template_name(doc_type: str) -> Optional[str]:
+    """小写归一并查表（缓存常见输入）"""
+    return _TEMPLATE_MAP.get(doc_type.lower())
+
+
+# 旧式中文占位符 → format_map 键（load_template 缓存前一次性转换）
+_LEGACY_PLACEHOLDERS = (
+    ("[产品名]", "{product_name}"),
+    ("[系统名]", "{product_name}"),
+    ("[日期]", "{date}"),
+)
+
+
+@lru_cache(maxsize=64)
+def _ensure_dir(path_str: str) -> None:
+    """幂等建目录（已确认存在的路径直接命中缓存，免重复 stat/mkdir）"""
+    Path(path_str).mkdir(parents=True, exist_ok=True)
+
+
+class _SafeFmt(dict):
+    """format_map 回退字典：缺失键原样保留占位符，不抛 KeyError"""
+
+    def __missing__(self, key):
+        return "{" + key + "}"
+
 
 class DocumentGenerator:
     """文档生成器"""
-    
+
+    # 类级模板缓存：同一进程内相同模板文件只读一次磁盘
+    _template_cache: Dict[str, str] = {}
+
     def __init__(self, skill_dir: Optional[Path] = None):
         if skill_dir is None:
             current = Path.cwd()
@@ -26,38 +70,40 @@ class DocumentGenerator:
     
     def ensure_output_dir(self):
         """确保输出目录存在"""
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(str(self.output_dir))
         return self.output_dir
     
     def load_template(self, template_name: str) -> str:
-        """加载模板文件"""
+        """加载模板文件（带类级缓存）"""
         template_path = self.templates_dir / f"{template_name}.md"
+        cache_key = str(template_path)
+        cached = self._template_cache.get(cache_key)
+        if cached is not None:
+            return cached
         if not template_path.exists():
             raise FileNotFoundError(f"模板不存在: {template_path}")
-        return template_path.read_text(encoding="utf-8")
-    
+        content = self._prepare_template(template_path.read_text(encoding="utf-8"))
+        self._template_cache[cache_key] = content
+        return content
+
+    @staticmethod
+    def _prepare_template(content: str) -> str:
+        """缓存前一次性预处理：转义字面大括号，旧式占位符转为 format_map 键"""
+        content = content.replace("{", "{{").replace("}", "}}")
+        for legacy, key in _LEGACY_PLACEHOLDERS:
+            content = content.replace(legacy, key)
+        return content
+
     def fill_template(self, template: str, data: Dict) -> str:
-        """填充模板变量"""
-        result = template
-        result = result.replace("[产品名]", data.get("product_name", "[产品名]"))
-        result = result.replace("[系统名]", data.get("product_name", "[系统名]"))
-        result = result.replace("[日期]", datetime.now().strftime("%Y-%m-%d"))
-        return result
+        """填充模板变量（单次 format_map 扫描替代多趟 replace）"""
+        fields = _SafeFmt(data)
+        fields.setdefault("product_name", "[产品名]")
+        fields["date"] = datetime.now().strftime("%Y-%m-%d")
+        return template.format_map(fields)
     
     def generate(self, doc_type: str, data: Dict) -> Path:
         """生成文档"""
-        template_map = {
-            "prd": "PRD",
-            "architecture": "ARCHITECTURE",
-            "arch": "ARCHITECTURE",
-            "ui": "UI_SPEC",
-            "ux": "INTERACTION",
-            "interaction": "INTERACTION",
-            "code-review": "CODE_REVIEW",
-            "code": "CODE_REVIEW"
-        }
-        
-        template_name = template_map.get(doc_type.lower())
+        template_name = _resolve_template_name(doc_type)
         if not template_name:
             raise ValueError(f"未知文档类型: {doc_type}")
         
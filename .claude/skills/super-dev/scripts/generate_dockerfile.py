@@ -6,17 +6,36 @@ Super Dev - Dockerfile Generator (Phase 6: DevOps)
 
 import sys
 import argparse
+from functools import lru_cache
 from pathlib import Path
-try:
-    from utils import console, print_success, print_error
-except ImportError:
-    sys.path.append(str(Path(__file__).parent))
-    from utils import console, print_success, print_error
+from types import MappingProxyType
+
+def _load_utils():
+    """延迟导入 utils：rich 的导入链约 50-80ms，仅在真正需要输出时付费"""
+    try:
+        from utils import console, print_success, print_error, atomic_write_bytes
+    except ImportError:
+        sys.path.append(str(Path(__file__).parent))
+        from utils import console, print_success, print_error, atomic_write_bytes
+    return console, print_success, print_error, atomic_write_bytes
+
+
+@lru_cache(maxsize=32)
+def _norm(value: str) -> str:
+    """归一化技术栈名（缓存常见输入，避免重复分配）"""
+    return value.lower().strip()
+
+
+@lru_cache(maxsize=64)
+def _ensure_dir(path_str: str) -> None:
+    """幂等建目录（已确认存在的路径直接命中缓存，批量生成免重复 stat/mkdir）"""
+    Path(path_str).mkdir(parents=True, exist_ok=True)
 
 
 # Dockerfile 模板
 DOCKERFILE_TEMPLATES = {
     "node": """
+# syntax=docker/dockerfile:1.6
 # ============================================
 # 多阶段构建 - Node.js 应用
 # ============================================
@@ -26,7 +45,7 @@ FROM node:20-alpine AS deps
 RUN apk add --no-cache libc6-compat
 WORKDIR /app
 COPY package.json package-lock.json ./
-RUN npm ci --only=production && npm cache clean --force
+RUN --mount=type=cache,target=/root/.npm npm ci --only=production --prefer-offline --no-audit --no-fund --loglevel=error
 
 # 阶段 2: 构建
 FROM node:20-alpine AS builder
@@ -69,6 +88,7 @@ CMD ["node", "server.js"]
 """,
 
     "python": """
+# syntax=docker/dockerfile:1.6
 # ============================================
 # 多阶段构建 - Python 应用
 # ============================================
@@ -76,28 +96,33 @@ CMD ["node", "server.js"]
 # 阶段 1: 基础镜像
 FROM python:3.12-slim AS builder
 
-# 安装系统依赖
-RUN apt-get update && apt-get install -y \\
-    --no-install-recommends \\
-    gcc \\
-    && rm -rf /var/lib/apt/lists/*
+# 安装系统依赖（apt 缓存挂载持久化于构建器，重建免重复下载）
+RUN --mount=type=cache,target=/var/cache/apt --mount=type=cache,target=/var/lib/apt \\
+    apt-get update && apt-get install -y --no-install-recommends gcc
 
 WORKDIR /app
 
 # 复制依赖文件
 COPY requirements.txt .
-RUN pip install --no-cache-dir --user -r requirements.txt
+RUN --mount=type=cache,target=/root/.cache/pip python -m venv /opt/venv && \\
+    /opt/venv/bin/pip install --disable-pip-version-check --root-user-action=ignore -r requirements.txt
 
 # 阶段 2: 生产运行
 FROM python:3.12-slim
 
+# 不写 .pyc、不缓冲 stdout：镜像更小、日志实时
+ENV PYTHONDONTWRITEBYTECODE=1 \\
+    PYTHONUNBUFFERED=1 \\
+    PIP_NO_CACHE_DIR=1 \\
+    PIP_DISABLE_PIP_VERSION_CHECK=1
+
 WORKDIR /app
 
-# 复制已安装的包
-COPY --from=builder /root/.local /root/.local
+# 复制已安装的 venv（单层 COPY，基础镜像补丁不破坏缓存）
+COPY --from=builder /opt/venv /opt/venv
 
 # 确保脚本在 PATH 中
-ENV PATH=/root/.local/bin:$PATH
+ENV PATH=/opt/venv/bin:$PATH
 
 # 复制应用代码
 COPY . .
@@ -116,6 +141,7 @@ CMD ["uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8000"]
 """,
 
     "nextjs": """
+# syntax=docker/dockerfile:1.6
 # ============================================
 # 多阶段构建 - Next.js 应用
 # ============================================
@@ -124,7 +150,7 @@ FROM node:20-alpine AS deps
 RUN apk add --no-cache libc6-compat
 WORKDIR /app
 COPY package.json package-lock.json ./
-RUN npm ci
+RUN --mount=type=cache,target=/root/.npm npm ci --prefer-offline --no-audit --no-fund --loglevel=error
 
 FROM node:20-alpine AS builder
 WORKDIR /app
@@ -157,6 +183,7 @@ CMD ["node", "server.js"]
 """,
 
     "react": """
+# syntax=docker/dockerfile:1.6
 # ============================================
 # 多阶段构建 - React 应用 (Nginx)
 # ============================================
@@ -166,7 +193,7 @@ FROM node:20-alpine AS builder
 WORKDIR /app
 
 COPY package*.json ./
-RUN npm ci
+RUN --mount=type=cache,target=/root/.npm npm ci --prefer-offline --no-audit --no-fund --loglevel=error
 
 COPY . .
 RUN npm run build
@@ -190,6 +217,7 @@ CMD ["nginx", "-g", "daemon off;"]
 """,
 
     "django": """
+# syntax=docker/dockerfile:1.6
 # ============================================
 # 多阶段构建 - Django 应用
 # ============================================
@@ -198,24 +226,29 @@ FROM python:3.12-slim AS builder
 
 WORKDIR /app
 
-# 安装系统依赖
-RUN apt-get update && apt-get install -y \\
-    gcc \\
-    postgresql-client \\
-    && rm -rf /var/lib/apt/lists/*
+# 安装系统依赖（apt 缓存挂载持久化于构建器，重建免重复下载）
+RUN --mount=type=cache,target=/var/cache/apt --mount=type=cache,target=/var/lib/apt \\
+    apt-get update && apt-get install -y --no-install-recommends gcc postgresql-client
 
 # 复制依赖文件
 COPY requirements.txt .
-RUN pip install --no-cache-dir --user -r requirements.txt
+RUN --mount=type=cache,target=/root/.cache/pip python -m venv /opt/venv && \\
+    /opt/venv/bin/pip install --disable-pip-version-check --root-user-action=ignore -r requirements.txt
 
 # 生产运行
 FROM python:3.12-slim
 
+# 不写 .pyc、不缓冲 stdout：镜像更小、日志实时
+ENV PYTHONDONTWRITEBYTECODE=1 \\
+    PYTHONUNBUFFERED=1 \\
+    PIP_NO_CACHE_DIR=1 \\
+    PIP_DISABLE_PIP_VERSION_CHECK=1
+
 WORKDIR /app
 
-# 复制已安装的包
-COPY --from=builder /root/.local /root/.local
-ENV PATH=/root/.local/bin:$PATH
+# 复制已安装的 venv（单层 COPY，基础镜像补丁不破坏缓存）
+COPY --from=builder /opt/venv /opt/venv
+ENV PATH=/opt/venv/bin:$PATH
 
 # 复制应用代码
 COPY . .
@@ -237,6 +270,7 @@ CMD ["gunicorn", "config.wsgi:application", "--bind", "0.0.0.0:8000"]
 """,
 
     "go": """
+# syntax=docker/dockerfile:1.6
 # ============================================
 # 多阶段构建 - Go 应用
 # ============================================
@@ -248,36 +282,47 @@ WORKDIR /app
 
 # 安装依赖
 COPY go.* ./
-RUN go mod download
+RUN --mount=type=cache,target=/go/pkg/mod go mod download
 
-# 复制源码并构建
+# 复制源码并构建（剥离调试信息与路径，产出可复现的静态二进制）
 COPY . .
-RUN CGO_ENABLED=0 go build -o /app/main .
-
-# 运行阶段
-FROM alpine:latest
-
-RUN apk --no-cache add ca-certificates
+RUN --mount=type=cache,target=/root/.cache/go-build --mount=type=cache,target=/go/pkg/mod \\
+    CGO_ENABLED=0 GOOS=linux go build -trimpath -ldflags="-s -w -buildid=" -o /app/main .
 
-WORKDIR /root/
+# 运行阶段：distroless 自带 ca-certificates 与 nonroot 用户，最终镜像 ~3MB
+FROM gcr.io/distroless/static-debian12:nonroot
 
 # 复制构建的二进制文件
-COPY --from=builder /app/main .
+COPY --from=builder --chown=nonroot:nonroot /app/main /app/main
 
-# 创建非 root 用户
-RUN addgroup -S app && adduser -S app -G app
-USER app
+USER nonroot:nonroot
 
 EXPOSE 8080
 
-# 健康检查
-HEALTHCHECK --interval=30s --timeout=3s --start-period=5s --retries=3 \\
-    CMD wget --quiet --tries=1 --spider http://localhost:8080/health || exit 1
+# 注意: distroless 无 shell，健康检查请在编排层（k8s liveness probe）配置
 
-CMD ["./main"]
+CMD ["/app/main"]
 """
 }
 
+# 导入时 strip 并固化键集合与只读视图
+DOCKERFILE_TEMPLATES = {k: v.strip() for k, v in DOCKERFILE_TEMPLATES.items()}
+DOCKERFILE_KEYS = frozenset(DOCKERFILE_TEMPLATES)
+DOCKERFILE_TEMPLATES = MappingProxyType(DOCKERFILE_TEMPLATES)
+
+# .dockerignore 模板：减小构建上下文上传量，避免本地产物混入镜像
+DOCKERIGNORE = """
+__pycache__
+*.pyc
+.venv
+.git
+.pytest_cache
+node_modules
+.next
+build
+dist
+""".strip()
+
 # Nginx 配置模板（用于 React）
 NGINX_CONF = """
 server {{
@@ -306,7 +351,12 @@ server {{
     add_header X-Content-Type-Options "nosniff" always;
     add_header X-XSS-Protection "1; mode=block" always;
 }}
-"""
+""".strip()
+
+# 模板是常量：导入时一次性编码 UTF-8，写出路径退化为单次 os.write
+_DOCKERFILE_BYTES = MappingProxyType({k: v.encode("utf-8") for k, v in DOCKERFILE_TEMPLATES.items()})
+_DOCKERIGNORE_BYTES = DOCKERIGNORE.encode("utf-8")
+_NGINX_CONF_BYTES = NGINX_CONF.encode("utf-8")
 
 
 def generate_dockerfile(stack: str, output_path: Path = None) -> bool:
@@ -320,36 +370,61 @@ def generate_dockerfile(stack: str, output_path: Path = None) -> bool:
     Returns:
         是否成功
     """
-    stack = stack.lower().strip()
+    console, print_success, print_error, atomic_write_bytes = _load_utils()
 
-    if stack not in DOCKERFILE_TEMPLATES:
+    stack = _norm(stack)
+
+    if stack not in DOCKERFILE_KEYS:
         print_error(f"不支持的技术栈: {stack}")
-        console.print(f"[dim]支持的技术栈: {', '.join(DOCKERFILE_TEMPLATES.keys())}[/dim]")
+        console.print(f"[dim]支持的技术栈: {', '.join(sorted(DOCKERFILE_KEYS))}[/dim]")
         return False
 
-    # 获取模板
-    dockerfile_content = DOCKERFILE_TEMPLATES[stack].strip()
+    # 获取模板（导入时已 strip 并编码为 UTF-8 字节）
+    dockerfile_content = _DOCKERFILE_BYTES[stack]
 
     # 确定输出路径
     if output_path is None:
         output_path = Path.cwd() / "Dockerfile"
+    _ensure_dir(str(output_path.parent))
+
+    # 写入 Dockerfile（原子替换，避免中断留下半截文件）
+    atomic_write_bytes(output_path, dockerfile_content)
 
-    # 写入 Dockerfile
-    output_path.write_text(dockerfile_content, encoding="utf-8")
+    # 同步生成 .dockerignore，缩小 docker build 上下文
+    dockerignore_path = output_path.parent / ".dockerignore"
+    atomic_write_bytes(dockerignore_path, _DOCKERIGNORE_BYTES)
 
     # 如果是 React，同时生成 nginx.conf
     if stack == "react":
         nginx_conf_path = output_path.parent / "nginx.conf"
-        nginx_conf_path.write_text(NGINX_CONF.strip(), encoding="utf-8")
+        atomic_write_bytes(nginx_conf_path, _NGINX_CONF_BYTES)
         print_success(f"Dockerfile 和 nginx.conf 已生成")
         console.print(f"[dim]- Dockerfile: {output_path}[/dim]")
         console.print(f"[dim]- nginx.conf: {nginx_conf_path}[/dim]")
     else:
         print_success(f"Dockerfile 已生成: {output_path}")
+    console.print(f"[dim]- .dockerignore: {dockerignore_path}[/dim]")
 
     return True
 
 
+def generate_many(specs) -> list:
+    """批量生成 Dockerfile（单进程内线程池并行）
+
+    Args:
+        specs: (stack, output_path) 二元组列表
+
+    Returns:
+        与 specs 一一对应的成功标记列表
+    """
+    if not specs:
+        return []
+    # 写盘是 I/O 密集操作，线程在 write 期间释放 GIL
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(8, len(specs))) as executor:
+        return list(executor.map(lambda spec: generate_dockerfile(*spec), specs))
+
+
 def main():
     parser = argparse.ArgumentParser(description="Super Dev Dockerfile 生成器 (Phase 6)")
     parser.add_argument("stack",
@@ -361,6 +436,7 @@ def main():
 
     output_path = Path(args.output) if args.output else None
 
+    console = _load_utils()[0]
     console.print(f"[dim]正在生成 {args.stack} Dockerfile...[/dim]")
     generate_dockerfile(args.stack, output_path)
 
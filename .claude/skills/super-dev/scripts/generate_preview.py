@@ -7,12 +7,18 @@ Super Dev - Phantom Preview Generator (Phase 5)
 import sys
 import json
 import argparse
+from functools import lru_cache
 from pathlib import Path
+
+try:
+    import orjson  # SIMD 加速编码器，可选依赖
+except ImportError:
+    orjson = None
 try:
-    from utils import console, print_success, print_error
+    from utils import console, print_success, print_error, ensure_dir
 except ImportError:
     sys.path.append(str(Path(__file__).parent))
-    from utils import console, print_success, print_error
+    from utils import console, print_success, print_error, ensure_dir
 
 # 模板路径
 TEMPLATE_PATH = Path(__file__).parent.parent / "knowledge" / "components" / "prototype" / "base.html"
@@ -89,12 +95,18 @@ COMPONENT_TEMPLATES = {
 }
 
 
+@lru_cache(maxsize=1)
+def _read_template() -> str:
+    """读取模板字节并解码（read_bytes 跳过 BufferedIO/seek 路径）"""
+    return TEMPLATE_PATH.read_bytes().decode("utf-8")
+
+
 def load_template():
-    """加载 base.html 模板"""
+    """加载 base.html 模板（模板不可变，进程内只读一次磁盘）"""
     if not TEMPLATE_PATH.exists():
         print_error(f"模板文件不存在: {TEMPLATE_PATH}")
         return None
-    return TEMPLATE_PATH.read_text(encoding="utf-8")
+    return _read_template()
 
 
 def inject_vue_app(content: str, ui_config: dict) -> str:
@@ -123,13 +135,19 @@ def inject_vue_app(content: str, ui_config: dict) -> str:
         "year": ui_config.get("year", "2025")
     }
 
+    # 紧凑序列化（浏览器不关心缩进，省 O(N) 空白符）；有 orjson 时走 SIMD 路径
+    if orjson is not None:
+        vue_json = orjson.dumps(vue_data).decode("utf-8")
+    else:
+        vue_json = json.dumps(vue_data, ensure_ascii=False, separators=(",", ":"))
+
     # 构建 Vue 应用代码
     vue_app = f"""
-const { createApp } = Vue;
+const {{ createApp }} = Vue;
 
 createApp({{
     data() {{
-        return {json.dumps(vue_data, ensure_ascii=False, indent=12)};
+        return {vue_json};
     }},
     methods: {{
         handlePrimaryClick() {{
@@ -142,17 +160,19 @@ createApp({{
 }}).mount('#app');
 """
 
-    # 查找并替换 <!-- VUE_APP --> 占位符
-    if "<!-- VUE_APP -->" in content:
-        content = content.replace("<!-- VUE_APP -->", vue_app)
-    else:
+    # 查找并替换 <!-- VUE_APP --> 占位符。
+    # 无替换发生时 str.replace 原样返回同一对象，用身份判断代替
+    # 先 in 再 replace 的两遍扫描
+    new_content = content.replace("<!-- VUE_APP -->", vue_app, 1)
+    if new_content is content:
         # 如果没有占位符，在 #app 之前插入
-        content = content.replace(
+        new_content = content.replace(
             '<div id="app">',
-            f'<script>{vue_app}</script>\\n<div id="app">'
+            f'<script>{vue_app}</script>\n<div id="app">',
+            1
         )
 
-    return content
+    return new_content
 
 
 def generate_preview(ui_config: dict, output_path: Path = None):
@@ -175,9 +195,10 @@ def generate_preview(ui_config: dict, output_path: Path = None):
     # 确定输出路径
     if output_path is None:
         output_path = Path.cwd() / "preview.html"
+    ensure_dir(output_path.parent)
 
-    # 写入文件
-    output_path.write_text(content, encoding="utf-8")
+    # 写入文件（write_bytes 跳过 TextIOWrapper，单次 write 落盘）
+    output_path.write_bytes(content.encode("utf-8"))
 
     print_success(f"原型已生成: {output_path}")
     console.print(f"[dim]在浏览器中打开: file://{output_path.absolute()}[/dim]")
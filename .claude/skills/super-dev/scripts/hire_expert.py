@@ -6,17 +6,21 @@ Super Dev - The Spawner (hire_expert.py)
 
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from string import Template
-from ddgs import DDGS
 from rich.panel import Panel
 from rich.markdown import Markdown
 
 try:
     from utils import console, print_header, print_step, print_success, print_error, spinner
+    from template_engine import substitute_placeholders
+    from search_cache import get_ddgs, cached_ddgs_text
 except ImportError:
     sys.path.append(str(Path(__file__).parent))
     from utils import console, print_header, print_step, print_success, print_error, spinner
+    from template_engine import substitute_placeholders
+    from search_cache import get_ddgs, cached_ddgs_text
 
 TEMPLATE_PATH = Path(__file__).parent.parent / "experts" / "TEMPLATE.md"
 OUTPUT_DIR = Path(__file__).parent.parent / "experts"
@@ -32,38 +36,47 @@ def search_role_intel(role: str):
         "deliverables": []
     }
     
-    queries = [
-        f"{role} job description responsibilities senior",
-        f"{role} mindset philosophy best practices",
-        f"{role} deliverables artifacts output",
-        f"{role} interview questions senior"
-    ]
-    
-    with DDGS() as ddgs:
+    # 按结果桶命名查询，不再用位置下标（之前的第 4 条 interview 查询从未被消费）
+    queries = {
+        "mindset": f"{role} mindset philosophy best practices",
+        "focus": f"{role} job description responsibilities senior",
+        "deliverables": f"{role} deliverables artifacts output",
+    }
+
+    # 三路查询互不依赖，线程池并发，总耗时从 3×RTT 降到 max(RTT)
+    ddgs = get_ddgs()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        f_mindset = executor.submit(cached_ddgs_text, queries["mindset"], 2, ddgs)
+        f_focus = executor.submit(cached_ddgs_text, queries["focus"], 2, ddgs)
+        f_deliverables = executor.submit(cached_ddgs_text, queries["deliverables"], 3, ddgs)
+
         # 1. Mindset & Motto
         try:
-            res = list(ddgs.text(queries[1], max_results=2))
+            res = f_mindset.result()
             if res:
                 intel["mindset"] = res[0]['body'][:100] + "..."
-        except:
+        except Exception as e:
+            console.print(f"[warning]Mindset search failed: {e}[/warning]")
             intel["mindset"] = "Professional and Detail-Oriented"
 
         # 2. Responsibilities (Focus)
         try:
-            res = list(ddgs.text(queries[0], max_results=2))
+            res = f_focus.result()
             if res:
                 intel["focus"] = res[0]['body'][:150] + "..."
-        except:
+        except Exception as e:
+            console.print(f"[warning]Focus search failed: {e}[/warning]")
             intel["focus"] = "Efficiency, Quality, Reliability"
 
         # 3. Deliverables
         try:
-            res = list(ddgs.text(queries[2], max_results=3))
+            res = f_deliverables.result()
             if res:
                 for r in res:
                     intel["deliverables"].append(r['title'])
-        except:
-             intel["deliverables"] = ["Technical Report", "Strategy Doc"]
+        except Exception as e:
+            console.print(f"[warning]Deliverables search failed: {e}[/warning]")
+            intel["deliverables"] = ["Technical Report", "Strategy Doc"]
 
     return intel
 
@@ -78,10 +91,8 @@ def generate_expert(role: str, intel: dict):
     template_content = TEMPLATE_PATH.read_text(encoding="utf-8")
     
     # Simple substitution (Not using string.Template due to likely collisions with Markdown ${})
-    # We will use manual replace for {{ key }} style to be safe with Markdown
-    
-    content = template_content
-    
+    # {{ key }} style is safe with Markdown; all keys are replaced in one regex pass
+
     replacements = {
         "{{ role_name }}": role,
         "{{ role_alias }}": "Specialist",
@@ -96,13 +107,13 @@ def generate_expert(role: str, intel: dict):
         "{{ deliverable_1 }}": "Expert Analysis",
     }
     
-    for k, v in replacements.items():
-        content = content.replace(k, str(v))
-        
+    content = substitute_placeholders(template_content, replacements)
+
+
     # Generate filename
     filename = role.upper().replace(" ", "_") + ".md"
     output_path = OUTPUT_DIR / filename
-    output_path.write_text(content, encoding="utf-8")
+    output_path.write_bytes(content.encode("utf-8"))
     
     return output_path
 
@@ -4,7 +4,7 @@ Super Dev - 项目初始化工具
 创建标准输出目录结构
 """
 
-import sys
+import argparse
 from datetime import datetime
 from pathlib import Path
 
@@ -32,24 +32,22 @@ def init_project(project_name: str, output_base: Path = None):
 """
     
     readme_path = output_dir / "README.md"
-    readme_path.write_text(readme_content, encoding="utf-8")
+    readme_path.write_bytes(readme_content.encode("utf-8"))
     
     return output_dir
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Super Dev 项目初始化工具")
-        print()
-        print("用法: python init_project.py <项目名称>")
-        print()
-        print("示例: python init_project.py online-education")
-        sys.exit(0)
-    
-    project_name = sys.argv[1]
-    
-    print(f"初始化项目: {project_name}")
-    output_dir = init_project(project_name)
+    parser = argparse.ArgumentParser(
+        description="Super Dev 项目初始化工具",
+        epilog="示例: python init_project.py online-education"
+    )
+    parser.add_argument("project_name", help="项目名称")
+
+    args = parser.parse_args()
+
+    print(f"初始化项目: {args.project_name}")
+    output_dir = init_project(args.project_name)
     print(f"输出目录已创建: {output_dir}")
 
 
@@ -7,16 +7,18 @@ Super Dev - 自动化市场研究工具
 import sys
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from ddgs import DDGS
 from rich.markdown import Markdown
 from rich.panel import Panel
 try:
-    from utils import console, print_header, print_step, print_success, print_error, spinner
+    from utils import console, print_header, print_step, print_success, print_error, spinner, ensure_dir
+    from search_cache import get_ddgs, cached_ddgs_text
 except ImportError:
     # Fallback if running from a different directory context
     sys.path.append(str(Path(__file__).parent))
-    from utils import console, print_header, print_step, print_success, print_error, spinner
+    from utils import console, print_header, print_step, print_success, print_error, spinner, ensure_dir
+    from search_cache import get_ddgs, cached_ddgs_text
 
 def search_market_data(topic: str, region: str = "Global"):
     """
@@ -36,12 +38,16 @@ def search_market_data(topic: str, region: str = "Global"):
         f"top {topic} competitors {region}"
     ]
     
-    with DDGS() as ddgs:
-        for q in queries:
+    # 四路查询互不依赖，线程池并发执行，总耗时从 4×RTT 降到 max(RTT)
+    ddgs = get_ddgs()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {executor.submit(cached_ddgs_text, q, 3, ddgs): q for q in queries}
+        for future in as_completed(futures):
+            q = futures[future]
             try:
                 # Get top 3 results for each query
-                search_res = list(ddgs.text(q, max_results=3))
-                
+                search_res = future.result()
+
                 if "market size" in q:
                     results["market_size"].extend(search_res)
                 elif "trends" in q:
@@ -50,7 +56,7 @@ def search_market_data(topic: str, region: str = "Global"):
                     results["pain_points"].extend(search_res)
                 elif "competitors" in q:
                     results["competitors"].extend(search_res)
-                    
+
             except Exception as e:
                 console.print(f"[warning]Search failed for query '{q}': {e}[/warning]")
 
@@ -63,31 +69,32 @@ def generate_report(topic: str, data: dict):
      Here we structure the raw search snippets for the Agent to consume.)
     """
     
-    report = f"""# Market Research Report: {topic}
+    # 列表收集 + 单次 join：避免 += 逐段复制整个前缀
+    parts = [f"""# Market Research Report: {topic}
 
 ## 1. Market Size & Growth
-"""
+"""]
     if not data["market_size"]:
-        report += "- *No specific market size data found.*"
+        parts.append("- *No specific market size data found.*")
     else:
         for item in data["market_size"]:
-            report += f"- **{item['title']}**: {item['body']} ([Source]({item['href']}))\n"
+            parts.append(f"- **{item['title']}**: {item['body']} ([Source]({item['href']}))\n")
 
-    report += "\n## 2. Key Trends\n"
+    parts.append("\n## 2. Key Trends\n")
     if not data["trends"]:
-        report += "- *No specific trend data found.*"
+        parts.append("- *No specific trend data found.*")
     else:
         for item in data["trends"]:
-            report += f"- {item['body']} ([Source]({item['href']}))\n"
+            parts.append(f"- {item['body']} ([Source]({item['href']}))\n")
 
-    report += "\n## 3. User Pain Points\n"
+    parts.append("\n## 3. User Pain Points\n")
     if not data["pain_points"]:
-        report += "- *No specific pain point data found.*"
+        parts.append("- *No specific pain point data found.*")
     else:
         for item in data["pain_points"]:
-            report += f"- {item['body']}\n"
-            
-    return report
+            parts.append(f"- {item['body']}\n")
+
+    return "".join(parts)
 
 def main():
     parser = argparse.ArgumentParser(description="由 Super Dev 执行的市场研究工具")
@@ -108,8 +115,8 @@ def main():
     
     # Output to stdout for the Agent to read, or save to file
     output_path = Path.cwd() / "docs" / "market_research_raw.md"
-    output_path.parent.mkdir(exist_ok=True)
-    output_path.write_text(report, encoding="utf-8")
+    ensure_dir(output_path.parent)
+    output_path.write_bytes(report.encode("utf-8"))
     
     print_success(f"调研完成! 数据已保存至 {output_path}")
     console.print(Panel(Markdown(report[:1000] + "\n\n*(预览已截断)*"), title="报告预览"))
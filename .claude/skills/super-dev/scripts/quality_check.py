@@ -10,33 +10,56 @@ import sys
 from pathlib import Path
 from typing import List, Tuple
 
+# 结构检查正则：模块级预编译，跳过 re 包装层的缓存查找。
+# 模式全是 ASCII，直接在 UTF-8 原始字节上匹配，省一次整文件解码。
+# 三种标记合并为一个交替式：整个缓冲区只扫描一遍而非三遍。
+# 行首的 '# '/'## ' 前缀判定由 re 引擎在 C 层完成，Python 侧没有逐行分支
+_RE_STRUCT = re.compile(rb'^(?P<h1># .+)|^(?P<h2>## .+)|(?P<table>\|.+\|)', re.MULTILINE)
+
+
+def _scan_structure(content: bytes):
+    """单遍扫描，返回 (h1_count, h2_count, has_table)"""
+    h1 = h2 = 0
+    has_table = False
+    for m in _RE_STRUCT.finditer(content):
+        group = m.lastgroup
+        if group == "h2":
+            h2 += 1
+        elif group == "h1":
+            h1 += 1
+        else:
+            has_table = True
+    return h1, h2, has_table
+
 
 class QualityChecker:
     """文档质量检查器"""
-    
-    def check_structure(self, content: str) -> List[Tuple[str, bool, str]]:
-        """检查文档结构"""
+
+    def check_structure(self, content) -> List[Tuple[str, bool, str]]:
+        """检查文档结构（接受 str 或 UTF-8 bytes）"""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
         checks = []
-        
-        if re.search(r'^# .+', content, re.MULTILINE):
+        h1_count, h2_count, has_table = _scan_structure(content)
+
+        if h1_count:
             checks.append(("有一级标题", True, ""))
         else:
             checks.append(("有一级标题", False, "文档应该有一级标题"))
-        
-        h2_count = len(re.findall(r'^## .+', content, re.MULTILINE))
+
         if h2_count >= 3:
             checks.append(("有足够章节", True, f"共 {h2_count} 个章节"))
         else:
             checks.append(("有足够章节", False, f"只有 {h2_count} 个章节"))
-        
-        if re.search(r'\|.+\|', content):
+
+        if has_table:
             checks.append(("包含表格", True, ""))
         else:
             checks.append(("包含表格", False, "建议使用表格"))
         
         return checks
     
-    def run_checks(self, content: str) -> dict:
+    def run_checks(self, content) -> dict:
         """执行所有检查"""
         all_checks = self.check_structure(content)
         
@@ -88,7 +111,8 @@ def main():
     args = parser.parse_args()
 
     try:
-        content = Path(args.file).read_text(encoding="utf-8")
+        # 结构检查在字节层进行，整文件无需解码
+        content = Path(args.file).read_bytes()
     except FileNotFoundError:
         print(f"文件不存在: {args.file}", file=sys.stderr)
         sys.exit(1)
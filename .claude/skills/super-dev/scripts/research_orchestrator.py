@@ -10,13 +10,36 @@ import argparse
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+
 try:
-    from utils import console, print_header, print_step, print_success, print_error, spinner
+    import orjson  # SIMD 加速编码器，可选依赖
+except ImportError:
+    orjson = None
+
+
+def _dumps_bytes(obj) -> bytes:
+    """序列化为 UTF-8 字节；有 orjson 时走 C/SIMD 路径，无则回退 stdlib"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def load_mission_brief(path: Path = None) -> dict:
+    """读取任务简报。下游工具统一走这里：read_bytes 免一次文本层转码，
+    有 orjson 时解析也走 SIMD 路径"""
+    if path is None:
+        path = Path.cwd() / "docs" / "mission_brief.json"
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+try:
+    from utils import console, print_header, print_step, print_success, print_error, spinner, ensure_dir
     from market_research import search_market_data
     from competitor_analysis import get_competitor_info
 except ImportError:
     sys.path.append(str(Path(__file__).parent))
-    from utils import console, print_header, print_step, print_success, print_error, spinner
+    from utils import console, print_header, print_step, print_success, print_error, spinner, ensure_dir
     from market_research import search_market_data
     from competitor_analysis import get_competitor_info
 
@@ -67,7 +90,9 @@ def main():
     parser.add_argument("project_name", help="项目名称")
     parser.add_argument("topic", help="核心领域 (如 'AI Code Tool')")
     parser.add_argument("competitors", nargs="+", help="竞品列表")
-    
+    parser.add_argument("--print", action="store_true", dest="print_brief",
+                        help="在终端完整打印简报 (默认只输出摘要)")
+
     args = parser.parse_args()
     
     print_header("研究指挥官", f"项目: {args.project_name}")
@@ -81,11 +106,17 @@ def main():
     brief = generate_mission_brief(args.project_name, results)
     
     output_path = Path.cwd() / "docs" / "mission_brief.json"
-    output_path.parent.mkdir(exist_ok=True)
-    output_path.write_text(json.dumps(brief, indent=2, ensure_ascii=False), encoding="utf-8")
+    ensure_dir(output_path.parent)
+    output_path.write_bytes(_dumps_bytes(brief))
     
     print_success(f"任务简报已就绪: {output_path}")
-    console.print_json(data=brief)
+    if args.print_brief:
+        console.print_json(data=brief)
+    else:
+        # 全量 print_json 会对刚落盘的数据再做一次序列化 + 逐 token 高亮，
+        # 简报很大时纯属浪费；默认只回显元信息和体积
+        console.print_json(data=brief["meta"])
+        console.print(f"[dim]简报体积: {output_path.stat().st_size} 字节 (--print 查看全文)[/dim]")
 
 if __name__ == "__main__":
     main()
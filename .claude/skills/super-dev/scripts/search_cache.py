@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Super Dev - 搜索结果磁盘缓存
+功能：缓存 DDGS 搜索结果到磁盘，同一查询 24 小时内直接读缓存，免去网络往返。
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent.parent / ".search_cache"
+CACHE_TTL = 24 * 3600  # 搜索结果按天级稳定，超过 24 小时强制刷新
+
+_cache_enabled = True
+_ddgs_session = None
+
+
+def get_ddgs():
+    """进程级共享 DDGS 会话，跨脚本复用底层 HTTP 连接"""
+    global _ddgs_session
+    if _ddgs_session is None:
+        from ddgs import DDGS
+        # timeout=5：搜索失败快速回退到兜底文案，别吊着并发线程
+        _ddgs_session = DDGS(timeout=5)
+    return _ddgs_session
+
+
+def disable_cache():
+    """禁用缓存（对应脚本的 --no-cache 开关）"""
+    global _cache_enabled
+    _cache_enabled = False
+
+
+def _cache_path(query: str, max_results: int) -> Path:
+    digest = hashlib.sha1(f"{query}|{max_results}".encode()).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def cached_ddgs_text(query: str, max_results: int = 3, ddgs=None) -> list:
+    """
+    带磁盘缓存的 ddgs.text。
+
+    命中未过期缓存时直接返回磁盘内容；否则走网络并回写缓存。
+    传入 ddgs 会话则复用，否则临时开一个。
+    """
+    path = _cache_path(query, max_results)
+    if _cache_enabled and path.exists():
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            if time.time() - entry["timestamp"] < CACHE_TTL:
+                return entry["results"]
+        except (ValueError, KeyError):
+            pass  # 损坏的缓存条目按未命中处理
+
+    if ddgs is None:
+        ddgs = get_ddgs()
+    results = list(ddgs.text(query, max_results=max_results))
+
+    if _cache_enabled:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"timestamp": time.time(), "results": results}, ensure_ascii=False),
+            encoding="utf-8"
+        )
+    return results
@@ -6,20 +6,53 @@ Language: English (Strict)
 """
 
 import sys
+import re
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
 
 # Configuration
 KNOWLEDGE_BASE = Path(__file__).parent.parent / "knowledge"
 COMPONENTS = KNOWLEDGE_BASE / "components"
 
+# Language Pack (module-level: built once, not per assemble_prd call;
+# proxy-wrapped so shared state can't be mutated by callers — lookups cost nothing extra)
+LANG_PACK = MappingProxyType({
+    "cn": {
+        "web": "Web端", "mobile": "移动端 (App)", "wechat": "微信小程序", "desktop": "桌面端",
+        "vision": "(待填充项目愿景)", "audience": "(待填充目标用户)", "problem": "(待填充核心痛点)"
+    },
+    "en": {
+        "web": "Web Application", "mobile": "Mobile App", "wechat": "WeChat Mini Program", "desktop": "Desktop App",
+        "vision": "(Vision TBD)", "audience": "(Target Audience TBD)", "problem": "(Core Pain Points TBD)"
+    }
+})
+
+
+@lru_cache(maxsize=16)
+def _placeholder_pattern(keys: tuple) -> "re.Pattern":
+    """Compile one alternation regex per distinct key set (cached across renders)."""
+    return re.compile("|".join(map(re.escape, keys)))
+
+
+def substitute_placeholders(content: str, replacements: dict) -> str:
+    """Replace all placeholder keys in a single C-level regex pass.
+
+    Chained str.replace rescans (and reallocates) the whole document once
+    per key; one combined alternation does it in a single scan.
+    """
+    pattern = _placeholder_pattern(tuple(replacements))
+    return pattern.sub(lambda m: str(replacements[m.group(0)]), content)
+
+@lru_cache(maxsize=128)
 def load_component(category: str, name: str) -> str:
-    """Load a specific markdown component."""
+    """Load a specific markdown component (cached: components are immutable per run)."""
     path = COMPONENTS / category / f"{name}.md"
     if not path.exists():
         return f"<!-- Missing Component: {category}/{name} -->"
-    return path.read_text(encoding="utf-8")
+    return path.read_bytes().decode("utf-8")
 
 def assemble_prd(platform: str, domain: str, project_name: str, lang: str = "cn") -> str:
     """Assemble a PRD based on platform and domain."""
@@ -28,35 +61,32 @@ def assemble_prd(platform: str, domain: str, project_name: str, lang: str = "cn"
     content = load_component("prd", "base")
     
     # 2. Inject Platform Specifics
-    platform_section = load_component("prd", platform) if platform in ["mobile", "web", "wechat"] else ""
-    
-    # Language Pack
-    LANG_PACK = {
-        "cn": {
-            "web": "Web端", "mobile": "移动端 (App)", "wechat": "微信小程序", "desktop": "桌面端",
-            "vision": "(待填充项目愿景)", "audience": "(待填充目标用户)", "problem": "(待填充核心痛点)"
-        },
-        "en": {
-            "web": "Web Application", "mobile": "Mobile App", "wechat": "WeChat Mini Program", "desktop": "Desktop App",
-            "vision": "(Vision TBD)", "audience": "(Target Audience TBD)", "problem": "(Core Pain Points TBD)"
-        }
-    }
-    
+    platform_section = load_component("prd", platform) if platform in ("mobile", "web", "wechat") else ""
+
     current_pack = LANG_PACK.get(lang, LANG_PACK["cn"])
     
     # 3. Inject Domain Specifics (Placeholder for Phase 3)
     domain_section = "" 
     # if domain == "saas": domain_section = load_component("prd", "saas")
     
-    # 4. Assembly
-    full_doc = f"{content}\n\n{platform_section}\n\n{domain_section}"
+    # 4. Assembly (skip empty sections: join allocates once, sized exactly)
+    parts = [content]
+    if platform_section:
+        parts.append(platform_section)
+    if domain_section:
+        parts.append(domain_section)
+    full_doc = "\n\n".join(parts)
     
     # 5. Variable Replacement
+    # One clock read, no strftime: the three stamps derive from the same instant
+    now = datetime.now()
+    year = f"{now.year:04d}"
+    month = f"{now.month:02d}"
     replacements = {
         "{{ project_name }}": project_name,
-        "{{ year }}": datetime.now().strftime("%Y"),
-        "{{ month }}": datetime.now().strftime("%m"),
-        "{{ date }}": datetime.now().strftime("%Y-%m-%d"),
+        "{{ year }}": year,
+        "{{ month }}": month,
+        "{{ date }}": f"{year}-{month}-{now.day:02d}",
         "{{ platform }}": current_pack.get(platform, platform),
         "{{ section_number }}": "3", 
         "{{ vision }}": current_pack["vision"],
@@ -64,9 +94,8 @@ def assemble_prd(platform: str, domain: str, project_name: str, lang: str = "cn"
         "{{ problem_statement }}": current_pack["problem"],
     }
     
-    for key, val in replacements.items():
-        full_doc = full_doc.replace(key, val)
-        
+    full_doc = substitute_placeholders(full_doc, replacements)
+
     return full_doc
 
 def main():
@@ -4,17 +4,31 @@ Super Dev - End-to-End Workflow Test
 功能：验证完整的 6 阶段工作流是否正常运行
 """
 
+import os
 import sys
-import subprocess
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
+from rich.table import Table
+
+try:
+    import orjson  # SIMD 加速编码器，可选依赖
+except ImportError:
+    orjson = None
 try:
-    from utils import console, print_header, print_step, print_success, print_error, spinner
+    from utils import console, print_header, print_step, print_success, print_error, spinner, cached_exists, dir_entry_set
 except ImportError:
     sys.path.append(str(Path(__file__).parent))
-    from utils import console, print_header, print_step, print_success, print_error, spinner
+    from utils import console, print_header, print_step, print_success, print_error, spinner, cached_exists, dir_entry_set
+
+# 基准路径：模块级解析一次（resolve 同时消掉下游的符号链接遍历）
+_HERE = Path(__file__).resolve().parent
+_EXPERTS_DIR = _HERE.parent / "experts"
+_KNOWLEDGE_DIR = _HERE.parent / "knowledge"
 
 
 class WorkflowTester:
@@ -26,48 +40,43 @@ class WorkflowTester:
         self.test_dir = Path.cwd() / "test_output"
         self.test_dir.mkdir(exist_ok=True)
 
-    def log_result(self, phase: str, test_name: str, passed: bool, message: str = ""):
-        """记录测试结果"""
-        self.results.append({
+    def log_result(self, phase: str, test_name: str, passed: bool, message: str = "") -> dict:
+        """构造一条测试结果（由调用方收集，统一在报告阶段渲染）"""
+        return {
             "phase": phase,
             "test": test_name,
             "passed": passed,
             "message": message
-        })
-
-        status = "[green]PASS[/green]" if passed else "[red]FAIL[/red]"
-        console.print(f"{phase} > {test_name}: {status}")
-        if message:
-            console.print(f"  [dim]{message}[/dim]")
+        }
 
-    def test_phase_0_environment(self):
+    def test_phase_0_environment(self) -> list:
         """Phase 0: 环境激活测试"""
         print_step("Phase 0: 测试环境激活...")
+        results = []
 
-        # 测试 Python 依赖
-        try:
-            import ddgs
-            import rich
-            self.log_result("Phase 0", "Python 依赖检查", True, "ddgs 和 rich 已安装")
-        except ImportError as e:
-            self.log_result("Phase 0", "Python 依赖检查", False, f"缺失依赖: {e}")
+        # 测试 Python 依赖：find_spec 只查元数据，不执行模块顶层代码
+        missing_deps = [m for m in ("ddgs", "rich") if find_spec(m) is None]
+        if missing_deps:
+            results.append(self.log_result("Phase 0", "Python 依赖检查", False, f"缺失依赖: {', '.join(missing_deps)}"))
+        else:
+            results.append(self.log_result("Phase 0", "Python 依赖检查", True, "ddgs 和 rich 已安装"))
 
         # 测试专家文件存在性
-        experts_dir = Path(__file__).parent.parent / "experts"
+        # 一次 scandir 列目录，逐文件 stat 变成内存集合查询
+        expert_names = dir_entry_set(str(_EXPERTS_DIR))
         core_experts = ["PM.md", "ARCHITECT.md", "UI.md", "CODE.md", "SECURITY.md"]
-        missing = []
-        for expert in core_experts:
-            if not (experts_dir / expert).exists():
-                missing.append(expert)
+        missing = [expert for expert in core_experts if expert not in expert_names]
 
         if missing:
-            self.log_result("Phase 0", "专家文件检查", False, f"缺失: {', '.join(missing)}")
+            results.append(self.log_result("Phase 0", "专家文件检查", False, f"缺失: {', '.join(missing)}"))
         else:
-            self.log_result("Phase 0", "专家文件检查", True, f"所有 {len(core_experts)} 位专家就位")
+            results.append(self.log_result("Phase 0", "专家文件检查", True, f"所有 {len(core_experts)} 位专家就位"))
+        return results
 
-    def test_phase_2_intelligence(self):
+    def test_phase_2_intelligence(self) -> list:
         """Phase 2: 实时情报测试"""
         print_step("Phase 2: 测试实时情报收集...")
+        results = []
 
         # 测试研究脚本可执行性
         scripts = [
@@ -76,21 +85,21 @@ class WorkflowTester:
             ("domain_research.py", "领域研究")
         ]
 
+        script_names = dir_entry_set(str(_HERE))
         for script, name in scripts:
-            script_path = Path(__file__).parent / script
-            if script_path.exists():
-                self.log_result("Phase 2", f"{name}脚本", True, f"{script} 存在")
+            if script in script_names:
+                results.append(self.log_result("Phase 2", f"{name}脚本", True, f"{script} 存在"))
             else:
-                self.log_result("Phase 2", f"{name}脚本", False, f"{script} 不存在")
+                results.append(self.log_result("Phase 2", f"{name}脚本", False, f"{script} 不存在"))
+        return results
 
-    def test_phase_3_expert_activation(self):
+    def test_phase_3_expert_activation(self) -> list:
         """Phase 3: 专家激活测试"""
         print_step("Phase 3: 测试专家激活...")
+        results = []
 
         # 测试知识库组件
-        knowledge_dir = Path(__file__).parent.parent / "knowledge"
-        platforms_dir = knowledge_dir / "platforms"
-        components_dir = knowledge_dir / "components"
+        knowledge_dir = _KNOWLEDGE_DIR
 
         checks = [
             ("platforms/web.md", "Web 平台知识"),
@@ -101,30 +110,34 @@ class WorkflowTester:
 
         for rel_path, name in checks:
             file_path = knowledge_dir / rel_path
-            if file_path.exists():
-                self.log_result("Phase 3", name, True, f"{rel_path} 存在")
+            if cached_exists(str(file_path)):
+                results.append(self.log_result("Phase 3", name, True, f"{rel_path} 存在"))
             else:
-                self.log_result("Phase 3", name, False, f"{rel_path} 不存在")
+                results.append(self.log_result("Phase 3", name, False, f"{rel_path} 不存在"))
+        return results
 
-    def test_phase_4_quality_gate(self):
+    def test_phase_4_quality_gate(self) -> list:
         """Phase 4: 递归质检测试"""
         print_step("Phase 4: 测试质量门禁...")
+        results = []
 
         # 测试质量检查脚本
-        quality_script = Path(__file__).parent / "quality_check.py"
-        if quality_script.exists():
-            self.log_result("Phase 4", "质量检查脚本", True)
+        quality_script = _HERE / "quality_check.py"
+        if cached_exists(str(quality_script)):
+            results.append(self.log_result("Phase 4", "质量检查脚本", True))
         else:
-            self.log_result("Phase 4", "质量检查脚本", False)
+            results.append(self.log_result("Phase 4", "质量检查脚本", False))
+        return results
 
-    def test_phase_5_phantom_delivery(self):
+    def test_phase_5_phantom_delivery(self) -> list:
         """Phase 5: 幻影交付测试"""
         print_step("Phase 5: 测试幻影交付...")
+        results = []
 
         # 测试原型生成脚本
-        preview_script = Path(__file__).parent / "generate_preview.py"
-        if preview_script.exists():
-            self.log_result("Phase 5", "原型生成脚本", True)
+        preview_script = _HERE / "generate_preview.py"
+        if cached_exists(str(preview_script)):
+            results.append(self.log_result("Phase 5", "原型生成脚本", True))
 
             # 尝试生成一个测试原型
             try:
@@ -138,15 +151,17 @@ class WorkflowTester:
                 }
                 output_path = self.test_dir / "test_preview.html"
                 # 这里我们只验证脚本存在，不实际运行（避免依赖问题）
-                self.log_result("Phase 5", "原型生成配置", True)
+                results.append(self.log_result("Phase 5", "原型生成配置", True))
             except Exception as e:
-                self.log_result("Phase 5", "原型生成配置", False, str(e))
+                results.append(self.log_result("Phase 5", "原型生成配置", False, str(e)))
         else:
-            self.log_result("Phase 5", "原型生成脚本", False)
+            results.append(self.log_result("Phase 5", "原型生成脚本", False))
+        return results
 
-    def test_phase_6_industrial_complex(self):
+    def test_phase_6_industrial_complex(self) -> list:
         """Phase 6: 工业化部署测试"""
         print_step("Phase 6: 测试工业化部署...")
+        results = []
 
         # 测试部署脚本
         deployment_scripts = [
@@ -154,16 +169,18 @@ class WorkflowTester:
             ("generate_ci_cd.py", "CI/CD 配置生成")
         ]
 
+        script_names = dir_entry_set(str(_HERE))
         for script, name in deployment_scripts:
-            script_path = Path(__file__).parent / script
-            if script_path.exists():
-                self.log_result("Phase 6", name, True, f"{script} 存在")
+            if script in script_names:
+                results.append(self.log_result("Phase 6", name, True, f"{script} 存在"))
             else:
-                self.log_result("Phase 6", name, False, f"{script} 不存在")
+                results.append(self.log_result("Phase 6", name, False, f"{script} 不存在"))
+        return results
 
-    def test_phase_10_singularity(self):
+    def test_phase_10_singularity(self) -> list:
         """Phase 10: 奇点进化测试"""
         print_step("Phase 10: 测试奇点进化...")
+        results = []
 
         # 测试动态扩展脚本
         singularity_scripts = [
@@ -171,23 +188,26 @@ class WorkflowTester:
             ("clone_dna.py", "风格克隆")
         ]
 
+        script_names = dir_entry_set(str(_HERE))
         for script, name in singularity_scripts:
-            script_path = Path(__file__).parent / script
-            if script_path.exists():
-                self.log_result("Phase 10", name, True, f"{script} 存在")
+            if script in script_names:
+                results.append(self.log_result("Phase 10", name, True, f"{script} 存在"))
             else:
-                self.log_result("Phase 10", name, False, f"{script} 不存在")
+                results.append(self.log_result("Phase 10", name, False, f"{script} 不存在"))
+        return results
 
-    def test_integration(self):
+    def test_integration(self) -> list:
         """集成测试"""
         print_step("集成测试: 端到端流程...")
+        results = []
 
         # 测试完整研究流程
-        orchestrator_script = Path(__file__).parent / "research_orchestrator.py"
-        if orchestrator_script.exists():
-            self.log_result("Integration", "研究指挥官", True, "research_orchestrator.py 存在")
+        orchestrator_script = _HERE / "research_orchestrator.py"
+        if cached_exists(str(orchestrator_script)):
+            results.append(self.log_result("Integration", "研究指挥官", True, "research_orchestrator.py 存在"))
         else:
-            self.log_result("Integration", "研究指挥官", False, "research_orchestrator.py 不存在")
+            results.append(self.log_result("Integration", "研究指挥官", False, "research_orchestrator.py 不存在"))
+        return results
 
     def generate_report(self):
         """生成测试报告"""
@@ -211,26 +231,42 @@ class WorkflowTester:
             "results": self.results
         }
 
-        # 保存 JSON
+        # 保存 JSON：有 orjson 时直接写字节；否则流式 dump 到文件，
+        # 免去整份文档先在内存成串再转码
         report_path = self.test_dir / "workflow_test_report.json"
-        report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
-
-        # 打印摘要
-        console.print(f"\\n[bold]测试摘要:[/bold]")
-        console.print(f"  总计: {total}")
-        console.print(f"  [green]通过: {passed}[/green]")
+        if orjson is not None:
+            report_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with report_path.open("w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+
+        # 全部结果一次性渲染成表格：单次 write 取代逐条 print
+        table = Table(title="测试结果")
+        table.add_column("Phase")
+        table.add_column("Test")
+        table.add_column("Status")
+        table.add_column("Message", style="dim")
+        for r in self.results:
+            status = "[green]PASS[/green]" if r["passed"] else "[red]FAIL[/red]"
+            table.add_row(r["phase"], r["test"], status, r["message"])
+        console.print(table)
+
+        # 摘要同样一次渲染：无框无表头的两列表格，单次 write
+        summary = Table(title="测试摘要", show_header=False, box=None)
+        summary.add_row("总计", str(total))
+        summary.add_row("[green]通过[/green]", str(passed))
         if failed > 0:
-            console.print(f"  [red]失败: {failed}[/red]")
-        console.print(f"  通过率: {pass_rate:.1f}%")
+            summary.add_row("[red]失败[/red]", str(failed))
+        summary.add_row("通过率", f"{pass_rate:.1f}%")
+        console.print(summary)
 
         # 失败详情
         if failed > 0:
-            console.print(f"\\n[red]失败的测试:[/red]")
-            for r in self.results:
-                if not r["passed"]:
-                    console.print(f"  - {r['phase']} > {r['test']}: {r['message']}")
+            lines = [f"  - {r['phase']} > {r['test']}: {r['message']}"
+                     for r in self.results if not r["passed"]]
+            console.print("\n".join(["[red]失败的测试:[/red]"] + lines))
 
-        console.print(f"\\n[dim]详细报告: {report_path}[/dim]")
+        console.print(f"\n[dim]详细报告: {report_path}[/dim]")
 
         return pass_rate >= 80  # 80% 及格线
 
@@ -238,14 +274,22 @@ class WorkflowTester:
         """运行所有测试"""
         print_header("Super Dev 工作流测试", f"项目: {self.project_name}")
 
-        self.test_phase_0_environment()
-        self.test_phase_2_intelligence()
-        self.test_phase_3_expert_activation()
-        self.test_phase_4_quality_gate()
-        self.test_phase_5_phantom_delivery()
-        self.test_phase_6_industrial_complex()
-        self.test_phase_10_singularity()
-        self.test_integration()
+        # 各 phase 之间没有数据依赖，全是文件系统探测，线程池并发执行；
+        # 按提交顺序收集 future，报告顺序保持确定性
+        phases = [
+            self.test_phase_0_environment,
+            self.test_phase_2_intelligence,
+            self.test_phase_3_expert_activation,
+            self.test_phase_4_quality_gate,
+            self.test_phase_5_phantom_delivery,
+            self.test_phase_6_industrial_complex,
+            self.test_phase_10_singularity,
+            self.test_integration,
+        ]
+        workers = min(len(phases), max(1, (os.cpu_count() or 4) - 2))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(phase) for phase in phases]
+            self.results = list(chain.from_iterable(f.result() for f in futures))
 
         return self.generate_report()
 
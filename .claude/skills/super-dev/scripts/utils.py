@@ -3,12 +3,15 @@ Super Dev - Shared Utilities
 Provides unified logging, styling, and common helpers.
 """
 
+# Panel / Progress 延迟到使用处导入：大多数脚本只用 console 和打印助手，
+# 不必在 import utils 时就拉起 rich 的全部子模块
 from rich.console import Console
-from rich.panel import Panel
 from rich.theme import Theme
-from rich.progress import Progress, SpinnerColumn, TextColumn
+import os
 import sys
 import contextlib
+from functools import lru_cache
+from pathlib import Path
 
 # Custom theme for "Hacker/Professional" look
 theme = Theme({
@@ -24,6 +27,8 @@ console = Console(theme=theme)
 
 def print_header(title: str, subtitle: str = ""):
     """Print a stylized header."""
+    from rich.panel import Panel
+
     console.print()
     console.print(Panel(
         f"[bold white]{subtitle}[/bold white]",
@@ -45,9 +50,44 @@ def print_error(message: str):
     """Print an error message."""
     console.print(f"[error]✖ {message}[/error]")
 
+@lru_cache(maxsize=4096)
+def cached_exists(path_str: str) -> bool:
+    """Memoized os.path.exists — one stat per unique path per process."""
+    return os.path.exists(path_str)
+
+@lru_cache(maxsize=64)
+def dir_entry_set(path_str: str) -> frozenset:
+    """List a directory once and return its entry names.
+
+    Checking N files in the same directory then costs one getdents64
+    syscall plus N set lookups instead of N stats.
+    """
+    try:
+        with os.scandir(path_str) as it:
+            return frozenset(entry.name for entry in it)
+    except FileNotFoundError:
+        return frozenset()
+
+@lru_cache(maxsize=64)
+def ensure_dir(path: Path):
+    """Create a directory once per process; repeat calls skip the mkdir syscall."""
+    path.mkdir(parents=True, exist_ok=True)
+
+def atomic_write_bytes(path: Path, data: bytes, fsync: bool = False):
+    """Write data atomically: temp file + os.replace, so readers never see a partial file."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
 @contextlib.contextmanager
 def spinner(description: str):
     """Context manager for a loading spinner."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn("dots", style="magenta"),
         TextColumn("[bold white]{task.description}[/bold white]"),
@@ -5,6 +5,8 @@ Super Dev 项目分析器核心模块
 
 import ast
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable
 
@@ -29,6 +31,78 @@ from .models import (
 ProjectType = ProjectCategory
 
 
+# 语言扩展名映射
+_LANG_MAP = {
+    ".py": "Python",
+    ".js": "JavaScript",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".jsx": "JavaScript",
+    ".go": "Go",
+    ".java": "Java",
+    ".kt": "Kotlin",
+    ".swift": "Swift",
+    ".rb": "Ruby",
+    ".php": "PHP",
+    ".rs": "Rust",
+    ".cpp": "C++",
+    ".c": "C",
+    ".cs": "C#",
+    ".vue": "Vue",
+    ".svelte": "Svelte",
+}
+
+_SOURCE_EXTS = frozenset(_LANG_MAP)
+
+# 模式检测的语言映射
+_PY_EXTS = frozenset({".py"})
+_JS_LANG = {".js": "javascript", ".ts": "typescript", ".tsx": "typescript"}
+_JS_EXTS = frozenset(_JS_LANG)
+
+# 忽略的目录
+_IGNORE_DIRS = frozenset({
+    "node_modules", "__pycache__", ".git", "venv", "env",
+    ".venv", "dist", "build", "target", "bin", "obj",
+    ".next", ".nuxt", "coverage", ".pytest_cache",
+})
+
+
+# AST 模式检测关注的标识符；源码里一个都不含时连 ast.parse 都可以省掉
+# （'instance' 子串同时覆盖 _instance / get_instance）
+_PY_PATTERN_KEYWORDS = (
+    "instance", "__new__", "attach", "detach",
+    "notify", "subscribe", "unsubscribe",
+)
+
+# 目录结构树里展示的代码文件后缀
+_STRUCT_EXTS = frozenset({".py", ".js", ".ts", ".tsx", ".jsx", ".go", ".java"})
+
+# 文本模式检测的全部关键词并成一个多选一正则：整份源码只扫一遍，
+# 取代十余次独立的 `in content` 子串搜索。
+# 长词排在其子串之前（unsubscribe/subscribe 同属观察者组，吞并无碍）
+_TEXT_PATTERN_RE = re.compile(
+    r"getInstance|unsubscribe|subscribe|addEventListener|instance|private"
+    r"|create|Factory|factory|notify|emit|Strategy|execute|context"
+)
+
+
+def _tidy_tree(node: dict) -> dict | None:
+    """整理目录树：剪掉空目录，目录在前、各自按名称排序"""
+    dirs = {}
+    file_names = []
+    for name, child in node.items():
+        if isinstance(child, dict):
+            sub = _tidy_tree(child)
+            if sub:
+                dirs[name] = sub
+        else:
+            file_names.append(name)
+
+    result = {name: dirs[name] for name in sorted(dirs)}
+    result.update((name, None) for name in sorted(file_names))
+    return result or None
+
+
 class ProjectAnalyzer:
     """
     项目分析器
@@ -65,14 +139,15 @@ class ProjectAnalyzer:
         # 检测架构模式
         architecture_pattern = detect_architecture_pattern(self.project_path)
 
-        # 分析目录结构
-        directory_structure = self._analyze_directory_structure()
+        # 单次遍历同时产出目录结构、行数统计目标和模式检测目标，
+        # 三个分析阶段不再各自重走一遍文件树
+        directory_structure, count_targets, source_files = self._walk_once()
 
         # 统计文件和代码行数
-        file_count, total_lines, languages_used = self._count_files_and_lines()
+        file_count, total_lines, languages_used = self._count_files_and_lines(count_targets)
 
         # 检测设计模式
-        design_patterns = self._detect_design_patterns()
+        design_patterns = self._detect_design_patterns(source_files)
 
         self._report = ArchitectureReport(
             project_path=self.project_path,
@@ -88,6 +163,53 @@ class ProjectAnalyzer:
 
         return self._report
 
+    def _walk_once(
+        self, max_depth: int = 3
+    ) -> tuple[dict, list[tuple[str, str]], list[tuple[str, str]]]:
+        """单次 os.scandir 遍历，同时构建三个分析阶段的输入
+
+        Returns:
+            tuple: (目录结构树, 行数统计目标 (路径, 语言), 模式检测目标 (路径, 后缀))
+
+        目录树只物化到 max_depth 层，更深的目录仍会被遍历以供统计；
+        决策逻辑与三次独立遍历完全相同，省掉的是两遍重复的 stat 流量
+        """
+        tree: dict = {}
+        count_targets: list[tuple[str, str]] = []
+        source_files: list[tuple[str, str]] = []
+
+        # (目录路径, 树节点或 None, 深度)；超过 max_depth 的节点传 None
+        stack: list[tuple[str, dict | None, int]] = [(str(self.project_path), tree, 0)]
+        while stack:
+            current, node, depth = stack.pop()
+            try:
+                it = os.scandir(current)
+            except (PermissionError, FileNotFoundError):
+                continue
+            with it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name in _IGNORE_DIRS or name.startswith("."):
+                            continue
+                        child = None
+                        if node is not None and depth < max_depth:
+                            child = {}
+                            node[name] = child
+                        stack.append((entry.path, child, depth + 1))
+                    elif entry.is_file(follow_symlinks=False):
+                        ext = "." + name.rpartition(".")[2]
+                        lang = _LANG_MAP.get(ext)
+                        if lang is not None:
+                            count_targets.append((entry.path, lang))
+                        if ext in _PY_EXTS or ext in _JS_EXTS:
+                            source_files.append((entry.path, ext))
+                        if node is not None and ext in _STRUCT_EXTS \
+                                and not name.startswith("."):
+                            node[name] = None
+
+        return _tidy_tree(tree) or {}, count_targets, source_files
+
     def _analyze_directory_structure(self, max_depth: int = 3) -> dict:
         """
         分析目录结构
@@ -98,48 +220,17 @@ class ProjectAnalyzer:
         Returns:
             dict: 目录结构树
         """
-        result = {}
-
-        def _build_tree(path: Path, depth: int) -> dict | None:
-            if depth > max_depth:
-                return None
-
-            tree = {}
-            try:
-                for item in sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name)):
-                    # 跳过隐藏文件和目录
-                    if item.name.startswith("."):
-                        continue
-
-                    # 跳过常见忽略目录
-                    if item.name in ["node_modules", "__pycache__", ".git", "venv", "dist", "build"]:
-                        continue
-
-                    if item.is_dir():
-                        subtree = _build_tree(item, depth + 1)
-                        if subtree:
-                            tree[item.name] = subtree
-                    else:
-                        # 只包含代码文件
-                        if item.suffix in [".py", ".js", ".ts", ".tsx", ".jsx", ".go", ".java"]:
-                            tree[item.name] = None
-            except PermissionError:
-                pass
-
-            return tree if tree else None
-
-        top_tree = _build_tree(self.project_path, 0)
-        if top_tree:
-            result = top_tree
-
-        return result
+        return self._walk_once(max_depth)[0]
 
     def _count_files_and_lines(
-        self,
+        self, targets: list[tuple[str, str]] | None = None
     ) -> tuple[int, int, dict[str, int]]:
         """
         统计文件数量和代码行数
 
+        Args:
+            targets: 预收集的 (路径, 语言) 对；缺省时自行遍历一次
+
         Returns:
             tuple: (文件数量, 总行数, 各语言行数)
         """
@@ -147,109 +238,125 @@ class ProjectAnalyzer:
         total_lines = 0
         languages_used: dict[str, int] = {}
 
-        # 语言扩展名映射
-        lang_map = {
-            ".py": "Python",
-            ".js": "JavaScript",
-            ".ts": "TypeScript",
-            ".tsx": "TypeScript",
-            ".jsx": "JavaScript",
-            ".go": "Go",
-            ".java": "Java",
-            ".kt": "Kotlin",
-            ".swift": "Swift",
-            ".rb": "Ruby",
-            ".php": "PHP",
-            ".rs": "Rust",
-            ".cpp": "C++",
-            ".c": "C",
-            ".cs": "C#",
-            ".vue": "Vue",
-            ".svelte": "Svelte",
-        }
-
-        # 忽略的目录
-        ignore_dirs = {
-            "node_modules", "__pycache__", ".git", "venv", "env",
-            ".venv", "dist", "build", "target", "bin", "obj",
-            ".next", ".nuxt", "coverage", ".pytest_cache",
-        }
-
-        for root, dirs, files in os.walk(self.project_path):
-            # 过滤忽略的目录
-            dirs[:] = [d for d in dirs if d not in ignore_dirs]
+        # 读文件交给线程池：read() 释放 GIL，重叠的系统调用掩盖磁盘延迟
+        if targets is None:
+            targets = self._walk_once()[1]
 
-            for file in files:
-                suffix = Path(file).suffix
+        def _safe_count(path: str) -> int | None:
+            try:
+                return self._count_lines(path)
+            except IOError:
+                return None
 
-                if suffix not in lang_map:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            counts = executor.map(_safe_count, (path for path, _ in targets))
+            # 聚合在主线程完成，languages_used 无需加锁
+            for (_, lang), lines in zip(targets, counts):
+                if lines is None:
                     continue
-
-                file_path = Path(root) / file
-                try:
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        lines = len(f.readlines())
-                        total_lines += lines
-                        file_count += 1
-
-                        lang = lang_map[suffix]
-                        languages_used[lang] = languages_used.get(lang, 0) + lines
-                except (IOError, UnicodeDecodeError):
-                    pass
+                total_lines += lines
+                file_count += 1
+                languages_used[lang] = languages_used.get(lang, 0) + lines
 
         return file_count, total_lines, languages_used
 
-    def _detect_design_patterns(self) -> list[DesignPattern]:
+    @staticmethod
+    def _count_lines(file_path: str | Path) -> int:
+        """统计单个文件的行数
+
+        二进制模式按 1 MiB 块读取并数 ``b"\\n"``（C 层 memchr 循环），
+        不再解码 UTF-8、也不为每行分配一个 str 对象；
+        buffering=0 跳过 BufferedReader，免去一层中间缓冲拷贝
+        """
+        count = 0
+        chunk = b"\n"
+        with open(file_path, "rb", buffering=0) as f:
+            while True:
+                prev = chunk
+                chunk = f.read(1 << 20)
+                if not chunk:
+                    break
+                count += chunk.count(b"\n")
+        # readlines 会把无换行结尾的最后一行也算一行，保持一致
+        if prev and not prev.endswith(b"\n"):
+            count += 1
+        return count
+
+    def _detect_design_patterns(
+        self, source_files: list[tuple[str, str]] | None = None
+    ) -> list[DesignPattern]:
         """
         检测设计模式
 
+        Args:
+            source_files: 预收集的 (路径, 后缀) 对；缺省时自行遍历一次
+
         Returns:
             list[DesignPattern]: 检测到的设计模式列表
         """
+        if source_files is None:
+            source_files = self._walk_once()[2]
+
         patterns: list[DesignPattern] = []
 
         # 根据语言选择检测策略
         if self.project_path.joinpath("package.json").exists():
-            patterns.extend(self._detect_js_patterns())
+            patterns.extend(self._detect_js_patterns(source_files))
         elif (
             self.project_path.joinpath("requirements.txt").exists()
             or self.project_path.joinpath("pyproject.toml").exists()
         ):
-            patterns.extend(self._detect_python_patterns())
+            patterns.extend(self._detect_python_patterns(source_files))
 
         return patterns
 
-    def _detect_js_patterns(self) -> list[DesignPattern]:
+    def _detect_js_patterns(
+        self, source_files: list[tuple[str, str]]
+    ) -> list[DesignPattern]:
         """检测 JavaScript/TypeScript 设计模式"""
-        patterns: list[DesignPattern] = []
-
+        # 有 src/ 目录时只看其中的文件，用路径前缀过滤已收集的列表
         src_dir = self.project_path / "src"
-        if not src_dir.exists():
-            src_dir = self.project_path
-
-        # 遍历源文件
-        for js_file in src_dir.rglob("*.js"):
-            self._check_file_for_patterns(js_file, patterns, "javascript")
+        prefix = str(src_dir) + os.sep if src_dir.exists() else None
 
-        for ts_file in src_dir.rglob("*.ts"):
-            self._check_file_for_patterns(ts_file, patterns, "typescript")
-
-        for tsx_file in src_dir.rglob("*.tsx"):
-            self._check_file_for_patterns(tsx_file, patterns, "typescript")
-
-        return patterns
+        targets = [
+            (path, _JS_LANG[ext])
+            for path, ext in source_files
+            if ext in _JS_EXTS and (prefix is None or path.startswith(prefix))
+        ]
+        return self._scan_files_parallel(targets)
 
-    def _detect_python_patterns(self) -> list[DesignPattern]:
+    def _detect_python_patterns(
+        self, source_files: list[tuple[str, str]]
+    ) -> list[DesignPattern]:
         """检测 Python 设计模式"""
-        patterns: list[DesignPattern] = []
+        targets = [
+            (path, "python") for path, ext in source_files if ext in _PY_EXTS
+        ]
+        return self._scan_files_parallel(targets)
 
-        for py_file in self.project_path.rglob("*.py"):
-            self._check_file_for_patterns(py_file, patterns, "python")
+    @staticmethod
+    def _scan_files_parallel(targets: list[tuple[str, str]]) -> list[DesignPattern]:
+        """进程池并发扫描文件列表
 
+        ast.parse 是纯 CPU 工作且不释放 GIL，线程帮不上忙；
+        按文件粒度分给工作进程，chunksize 摊薄任务分发开销
+        """
+        patterns: list[DesignPattern] = []
+        if not targets:
+            return patterns
+
+        paths, languages = zip(*targets)
+        with ProcessPoolExecutor() as executor:
+            for file_patterns in executor.map(
+                _scan_file_for_patterns, paths, languages, chunksize=32
+            ):
+                patterns.extend(file_patterns)
         return patterns
 
+    @staticmethod
     def _check_file_for_patterns(
-        self, file_path: Path, patterns: list[DesignPattern], language: str
+        file_path: Path, patterns: list[DesignPattern], language: str
     ) -> None:
         """
         检查文件中的设计模式
@@ -263,35 +370,40 @@ class ProjectAnalyzer:
             content = file_path.read_text(encoding="utf-8")
 
             if language == "python":
-                self._detect_python_ast_patterns(file_path, patterns)
+                ProjectAnalyzer._detect_python_ast_patterns(file_path, content, patterns)
             else:
-                self._detect_text_based_patterns(file_path, content, patterns)
+                ProjectAnalyzer._detect_text_based_patterns(file_path, content, patterns)
 
         except (IOError, UnicodeDecodeError):
             pass
 
+    @staticmethod
     def _detect_python_ast_patterns(
-        self, file_path: Path, patterns: list[DesignPattern]
+        file_path: Path, content: str, patterns: list[DesignPattern]
     ) -> None:
-        """使用 AST 检测 Python 设计模式"""
+        """使用 AST 检测 Python 设计模式（content 由调用方读好，避免重复读盘）"""
+        # ast.parse 比子串扫描贵两个数量级；关键标识符全不出现时直接跳过
+        if not any(keyword in content for keyword in _PY_PATTERN_KEYWORDS):
+            return
+
         try:
-            content = file_path.read_text(encoding="utf-8")
             tree = ast.parse(content, filename=str(file_path))
 
             for node in ast.walk(tree):
                 # 检测 Singleton 模式
                 if isinstance(node, ast.ClassDef):
-                    self._check_singleton_class(node, file_path, patterns)
+                    ProjectAnalyzer._check_singleton_class(node, file_path, patterns)
 
                 # 检测 Observer 模式
                 if isinstance(node, ast.FunctionDef):
-                    self._check_observer_methods(node, file_path, patterns)
+                    ProjectAnalyzer._check_observer_methods(node, file_path, patterns)
 
-        except (SyntaxError, IOError):
+        except SyntaxError:
             pass
 
+    @staticmethod
     def _check_singleton_class(
-        self, class_node: ast.ClassDef, file_path: Path, patterns: list[DesignPattern]
+        class_node: ast.ClassDef, file_path: Path, patterns: list[DesignPattern]
     ) -> None:
         """检查 Singleton 模式"""
         # 查找 _instance 属性
@@ -317,8 +429,9 @@ class ProjectAnalyzer:
                 )
             )
 
+    @staticmethod
     def _check_observer_methods(
-        self, func_node: ast.FunctionDef, file_path: Path, patterns: list[DesignPattern]
+        func_node: ast.FunctionDef, file_path: Path, patterns: list[DesignPattern]
     ) -> None:
         """检查 Observer 模式相关方法"""
         observer_methods = ["attach", "detach", "notify", "subscribe", "unsubscribe"]
@@ -333,13 +446,15 @@ class ProjectAnalyzer:
                 )
             )
 
+    @staticmethod
     def _detect_text_based_patterns(
-        self, file_path: Path, content: str, patterns: list[DesignPattern]
+        file_path: Path, content: str, patterns: list[DesignPattern]
     ) -> None:
         """基于文本检测设计模式（适用于 JS/TS 等）"""
+        hits = set(_TEXT_PATTERN_RE.findall(content))
 
         # Singleton 检测
-        if "getInstance" in content or ("instance" in content and "private" in content):
+        if "getInstance" in hits or ("instance" in hits and "private" in hits):
             patterns.append(
                 DesignPattern(
                     name=PatternType.SINGLETON,
@@ -350,7 +465,7 @@ class ProjectAnalyzer:
             )
 
         # Factory 检测
-        if "create" in content and ("Factory" in content or "factory" in content):
+        if "create" in hits and ("Factory" in hits or "factory" in hits):
             patterns.append(
                 DesignPattern(
                     name=PatternType.FACTORY,
@@ -361,8 +476,8 @@ class ProjectAnalyzer:
             )
 
         # Observer 检测
-        observer_keywords = ["subscribe", "unsubscribe", "notify", "emit", "addEventListener"]
-        if any(keyword in content for keyword in observer_keywords):
+        observer_keywords = ("subscribe", "unsubscribe", "notify", "emit", "addEventListener")
+        if not hits.isdisjoint(observer_keywords):
             patterns.append(
                 DesignPattern(
                     name=PatternType.OBSERVER,
@@ -373,7 +488,7 @@ class ProjectAnalyzer:
             )
 
         # Strategy 检测
-        if "Strategy" in content or ("execute" in content and "context" in content):
+        if "Strategy" in hits or ("execute" in hits and "context" in hits):
             patterns.append(
                 DesignPattern(
                     name=PatternType.STRATEGY,
@@ -441,3 +556,10 @@ class ProjectAnalyzer:
             lang: (count / total) * 100
             for lang, count in self._report.languages_used.items()
         }
+
+
+def _scan_file_for_patterns(path_str: str, language: str) -> list[DesignPattern]:
+    """进程池工作函数：扫描单个文件并返回检测到的模式（模块级才可 pickle）"""
+    patterns: list[DesignPattern] = []
+    ProjectAnalyzer._check_file_for_patterns(Path(path_str), patterns, language)
+    return patterns
@@ -8,6 +8,9 @@ Spec-Driven Development 生成器
 创建时间：2025-12-30
 """
 
+import contextlib
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -17,6 +20,75 @@ from .models import (
 )
 from .manager import SpecManager, ChangeManager
 
+# PRD 解析前缀：startswith 接受元组时在 C 层一次分派完成匹配
+_OVERVIEW_PREFIXES = ("## 概述", "## Overview")
+_FEATURE_PREFIXES = ("## 功能需求", "## Features")
+_BULLET_PREFIXES = ("- ", "* ")
+
+# init_sdd 模板：模块级常量，进程内只分配一次
+_AGENTS_MD = """# Super Dev Spec-Driven Development
+
+This project uses Super Dev's Spec-Driven Development (SDD) workflow.
+
+## Workflow
+
+1. **Propose**: Create a change proposal with `super-dev spec propose <id>`
+2. **Review**: Review the generated specs and tasks
+3. **Implement**: Work through the tasks with AI assistance
+4. **Archive**: Archive the change with `super-dev spec archive <id>`
+
+## Directory Structure
+
+```
+.super-dev/
+├── specs/          # Current specifications (source of truth)
+├── changes/        # Proposed changes (proposals + tasks + deltas)
+└── archive/        # Archived changes
+```
+
+## Commands
+
+- `super-dev spec list` - List all changes
+- `super-dev spec show <id>` - Show change details
+- `super-dev spec propose <id>` - Create new change proposal
+- `super-dev spec apply <id>` - Start implementing a change
+- `super-dev spec archive <id>` - Archive completed change
+
+## AI Integration
+
+When working with AI coding assistants, reference the change:
+
+"Please help me implement change `add-user-auth`. The tasks are in `.super-dev/changes/add-user-auth/tasks.md` and the specs are in `.super-dev/changes/add-user-auth/specs/`."
+"""
+
+_PROJECT_MD = """# Project Context
+
+## Purpose
+_What is this project about?_
+
+## Tech Stack
+- **Language**: _e.g., Python, JavaScript, Go_
+- **Framework**: _e.g., FastAPI, Express, Gin_
+- **Database**: _e.g., PostgreSQL, MongoDB_
+- **Frontend**: _e.g., React, Vue, None_
+
+## Conventions
+### Code Style
+- _e.g., PEP 8 for Python, ESLint + Prettier for JS_
+
+### Git Flow
+- _e.g., main for production, develop for integration_
+
+### Testing
+- _e.g., pytest with >80% coverage required_
+
+## Architecture Notes
+_Add architectural patterns and decisions here_
+
+## Domain Knowledge
+_Add domain-specific information here_
+"""
+
 
 class SpecGenerator:
     """规范生成器 - 从需求自动生成规范"""
@@ -26,6 +98,23 @@ class SpecGenerator:
         self.project_dir = Path(project_dir).resolve()
         self.spec_manager = SpecManager(self.project_dir)
         self.change_manager = ChangeManager(self.project_dir)
+        # 以 (change_id, change.yaml mtime) 为键缓存加载结果：
+        # save_change 末尾总会重写 change.yaml，磁盘变化自动令旧键失效
+        self._load_cached = lru_cache(maxsize=32)(self._load_with_mtime)
+
+    def _load_with_mtime(self, change_id: str, mtime_ns: int) -> Optional[Change]:
+        return self.change_manager.load_change(change_id)
+
+    def _load_change(self, change_id: str) -> Optional[Change]:
+        """带 mtime 失效的变更加载，连续读取同一变更只解析一次"""
+        meta_path = self.change_manager.get_change_path(change_id) / "change.yaml"
+        try:
+            mtime_ns = meta_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return self.change_manager.load_change(change_id)
+        # 深拷贝再返回：调用方（如 batch_changes）就地改写，若随后保存失败，
+        # 缓存里留着的仍是与磁盘一致的原始对象（与 manager 的解析缓存同理）
+        return copy.deepcopy(self._load_cached(change_id, mtime_ns))
 
     def create_change(
         self,
@@ -50,6 +139,19 @@ class SpecGenerator:
         self.change_manager.save_change(change)
         return change
 
+    @contextlib.contextmanager
+    def batch_changes(self, change_id: str):
+        """批量修改变更：加载一次，块内累积修改，退出时统一落盘。
+
+        配合 add_requirement_to_change(..., change=ch) 使用，
+        N 次添加从 N 次读写摊薄为一读一写。
+        """
+        change = self._load_change(change_id)
+        if not change:
+            raise FileNotFoundError(f"变更不存在: {change_id}")
+        yield change
+        self.change_manager.save_change(change)
+
     def add_requirement_to_change(
         self,
         change_id: str,
@@ -57,10 +159,13 @@ class SpecGenerator:
         requirement_name: str,
         description: str,
         scenarios: list[dict] | None = None,
-        delta_type: DeltaType = DeltaType.ADDED
+        delta_type: DeltaType = DeltaType.ADDED,
+        change: Optional[Change] = None
     ) -> SpecDelta:
-        """向变更添加需求"""
-        change = self.change_manager.load_change(change_id)
+        """向变更添加需求（传入已加载的 change 时跳过本次读写，由调用方统一保存）"""
+        batched = change is not None
+        if not batched:
+            change = self._load_change(change_id)
         if not change:
             raise FileNotFoundError(f"变更不存在: {change_id}")
 
@@ -81,20 +186,21 @@ class SpecGenerator:
         )
         requirement.scenarios = req_scenarios
 
-        # 查找或创建增量
-        for delta in change.spec_deltas:
-            if delta.spec_name == spec_name:
-                delta.requirements.append(requirement)
-                break
-        else:
+        # 查找或创建增量：字典索引取代逐项线性扫描
+        delta_index = {d.spec_name: d for d in change.spec_deltas}
+        delta = delta_index.get(spec_name)
+        if delta is None:
             delta = SpecDelta(
                 spec_name=spec_name,
                 delta_type=delta_type,
                 requirements=[requirement]
             )
             change.spec_deltas.append(delta)
+        else:
+            delta.requirements.append(requirement)
 
-        self.change_manager.save_change(change)
+        if not batched:
+            self.change_manager.save_change(change)
         return delta
 
     def generate_tasks_from_requirements(
@@ -103,40 +209,36 @@ class SpecGenerator:
         tech_stack: Optional[dict] = None
     ) -> list[Task]:
         """从需求自动生成任务"""
-        change = self.change_manager.load_change(change_id)
+        change = self._load_change(change_id)
         if not change:
             raise FileNotFoundError(f"变更不存在: {change_id}")
 
-        tasks = []
-        task_id = [1, 1]  # [major, minor]
-
-        # 根据规范增量生成任务
-        for delta in change.spec_deltas:
-            for req in delta.requirements:
-                # 为每个需求生成实现任务
-                task_id[1] += 1
-                task = Task(
-                    id=f"{task_id[0]}.{task_id[1]}",
-                    title=f"Implement: {req.name}",
-                    description=req.description,
-                    status=TaskStatus.PENDING,
-                    spec_refs=[f"{delta.spec_name}::{req.name}"]
-                )
-                tasks.append(task)
-
-        # 添加测试任务
-        task_id[0] += 1
-        task_id[1] = 0
-        for delta in change.spec_deltas:
-            task_id[1] += 1
-            task = Task(
-                id=f"{task_id[0]}.{task_id[1]}",
+        # 列表推导式走 LIST_APPEND 字节码，enumerate 直接供号，
+        # 免去循环里可变的 task_id 计数器和逐次方法查找；
+        # 枚举单例绑定为局部变量，循环内少一次 LOAD_GLOBAL+LOAD_ATTR
+        pending = TaskStatus.PENDING
+        pairs = [(delta, req) for delta in change.spec_deltas for req in delta.requirements]
+        impl_tasks = [
+            Task(
+                id=f"1.{i + 2}",
+                title=f"Implement: {req.name}",
+                description=req.description,
+                status=pending,
+                spec_refs=[f"{delta.spec_name}::{req.name}"]
+            )
+            for i, (delta, req) in enumerate(pairs)
+        ]
+        test_tasks = [
+            Task(
+                id=f"2.{i + 1}",
                 title=f"Test: {delta.spec_name} requirements",
                 description=f"Verify all scenarios for {delta.spec_name}",
-                status=TaskStatus.PENDING,
+                status=pending,
                 spec_refs=[delta.spec_name]
             )
-            tasks.append(task)
+            for i, delta in enumerate(change.spec_deltas)
+        ]
+        tasks = impl_tasks + test_tasks
 
         # 更新变更
         change.tasks = tasks
@@ -146,26 +248,27 @@ class SpecGenerator:
 
     def propose_from_prd(self, prd_content: str) -> Change:
         """从 PRD 内容生成变更提案 (简化版)"""
-        # 解析 PRD 提取关键信息
-        lines = prd_content.split("\n")
+        # 解析 PRD 提取关键信息（splitlines 为单个 C 循环，且正确处理 \r\n）
+        lines = prd_content.splitlines()
 
         title = "Feature from PRD"
-        description = ""
+        desc_parts = []
         features = []
 
         current_section = None
         for line in lines:
             if line.startswith("# "):
                 title = line[2:].strip()
-            elif line.startswith("## 概述") or line.startswith("## Overview"):
+            elif line.startswith(_OVERVIEW_PREFIXES):
                 current_section = "overview"
-            elif line.startswith("## 功能需求") or line.startswith("## Features"):
+            elif line.startswith(_FEATURE_PREFIXES):
                 current_section = "features"
-            elif line.startswith("- ") or line.startswith("* "):
+            elif line.startswith(_BULLET_PREFIXES):
                 if current_section == "features":
                     features.append(line[2:].strip())
             elif current_section == "overview" and line.strip():
-                description += line.strip() + "\n"
+                desc_parts.append(line.strip())
+        description = "\n".join(desc_parts)
 
         # 创建变更 ID
         change_id = title.lower().replace(" ", "-").replace("/", "-")[:50]
@@ -185,75 +288,20 @@ class SpecGenerator:
         self.spec_manager.init()
         self.change_manager.init()
 
-        # 创建 AGENTS.md 文件
+        # 创建 AGENTS.md / project.md：O_EXCL 独占创建，
+        # 一次 open 取代 stat+open，并发 init_sdd 也不会互相覆盖
         agents_path = self.project_dir / ".super-dev" / "AGENTS.md"
-        if not agents_path.exists():
-            agents_content = """# Super Dev Spec-Driven Development
-
-This project uses Super Dev's Spec-Driven Development (SDD) workflow.
-
-## Workflow
-
-1. **Propose**: Create a change proposal with `super-dev spec propose <id>`
-2. **Review**: Review the generated specs and tasks
-3. **Implement**: Work through the tasks with AI assistance
-4. **Archive**: Archive the change with `super-dev spec archive <id>`
-
-## Directory Structure
+        try:
+            with agents_path.open("x", encoding="utf-8") as f:
+                f.write(_AGENTS_MD)
+        except FileExistsError:
+            pass
 
-```
-.super-dev/
-├── specs/          # Current specifications (source of truth)
-├── changes/        # Proposed changes (proposals + tasks + deltas)
-└── archive/        # Archived changes
-```
-
-## Commands
-
-- `super-dev spec list` - List all changes
-- `super-dev spec show <id>` - Show change details
-- `super-dev spec propose <id>` - Create new change proposal
-- `super-dev spec apply <id>` - Start implementing a change
-- `super-dev spec archive <id>` - Archive completed change
-
-## AI Integration
-
-When working with AI coding assistants, reference the change:
-
-"Please help me implement change `add-user-auth`. The tasks are in `.super-dev/changes/add-user-auth/tasks.md` and the specs are in `.super-dev/changes/add-user-auth/specs/`."
-"""
-            agents_path.write_text(agents_content, encoding="utf-8")
-
-        # 创建 project.md 模板
         project_path = self.project_dir / ".super-dev" / "project.md"
-        if not project_path.exists():
-            project_content = """# Project Context
-
-## Purpose
-_What is this project about?_
-
-## Tech Stack
-- **Language**: _e.g., Python, JavaScript, Go_
-- **Framework**: _e.g., FastAPI, Express, Gin_
-- **Database**: _e.g., PostgreSQL, MongoDB_
-- **Frontend**: _e.g., React, Vue, None_
-
-## Conventions
-### Code Style
-- _e.g., PEP 8 for Python, ESLint + Prettier for JS_
-
-### Git Flow
-- _e.g., main for production, develop for integration_
-
-### Testing
-- _e.g., pytest with >80% coverage required_
-
-## Architecture Notes
-_Add architectural patterns and decisions here_
-
-## Domain Knowledge
-_Add domain-specific information here_
-"""
-            project_path.write_text(project_content, encoding="utf-8")
+        try:
+            with project_path.open("x", encoding="utf-8") as f:
+                f.write(_PROJECT_MD)
+        except FileExistsError:
+            pass
 
         return agents_path, project_path
@@ -8,10 +8,23 @@ Spec-Driven Development 管理器
 创建时间：2025-12-30
 """
 
-import yaml
+import copy
+import os
+import re
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
+
+import yaml
+
+# libyaml C 绑定比纯 Python 的发射/解析器快一个数量级；无 C 扩展时回退
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
 
 from .models import (
     Spec, Requirement, Scenario, Change, ChangeStatus,
@@ -19,6 +32,71 @@ from .models import (
 )
 
 
+# 解析缓存：以 (路径, mtime_ns, size) 为键，文件未变时跳过读盘和解析；
+# save_* 重写文件即换 mtime，旧键自然失效。返回前 deepcopy，调用方可随意改
+@lru_cache(maxsize=512)
+def _parse_spec_cached(spec_name: str, path_str: str, mtime_ns: int, size: int) -> Spec:
+    content = Path(path_str).read_text(encoding="utf-8")
+    return SpecManager._parse_spec(spec_name, content)
+
+
+@lru_cache(maxsize=512)
+def _parse_proposal_cached(path_str: str, mtime_ns: int, size: int) -> Proposal:
+    content = Path(path_str).read_text(encoding="utf-8")
+    return ChangeManager._parse_proposal(content)
+
+
+@lru_cache(maxsize=512)
+def _parse_tasks_cached(path_str: str, mtime_ns: int, size: int) -> tuple:
+    content = Path(path_str).read_text(encoding="utf-8")
+    return tuple(ChangeManager._parse_tasks(content))
+
+
+@lru_cache(maxsize=512)
+def _parse_meta_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    with open(path_str, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+# Markdown 行分类：单个多选一正则对全文做一次 C 层扫描，
+# 按 lastgroup 分派取代逐行十余次 startswith；空行天然不产生匹配
+_SPEC_RE = re.compile(
+    r"^(?:"
+    r"# (?P<title>.*)"
+    r"|## (?P<section>Purpose|Requirements).*"
+    r"|### Requirement:(?P<req>.*)"
+    r"|#### Scenario(?P<scenario>:.*)"
+    r"|- GIVEN(?P<given>.*)"
+    r"|- WHEN(?P<when>.*)"
+    r"|- THEN(?P<then>.*)"
+    r"|(?P<rfc>[^\S\n]*(?:SHALL|MUST|SHOULD|MAY).*)"
+    r"|(?P<text>.*\S.*)"
+    r")$",
+    re.MULTILINE,
+)
+
+_PROPOSAL_RE = re.compile(
+    r"^(?:"
+    r"## (?P<section>.*)"
+    r"|(?P<text>.*\S.*)"
+    r")$",
+    re.MULTILINE,
+)
+
+# 任务行: - [ ] **1.1: Task Title**
+_TASK_RE = re.compile(
+    r"^- \[(?P<st>[ ~x_])\]\s*\*\*(?P<id>[^:]+):\s*(?P<title>[^*]+)\*\*",
+    re.MULTILINE,
+)
+
+_TASK_STATUS = {
+    " ": TaskStatus.PENDING,
+    "~": TaskStatus.IN_PROGRESS,
+    "x": TaskStatus.COMPLETED,
+    "_": TaskStatus.SKIPPED,
+}
+
+
 class SpecManager:
     """规范管理器 - 管理当前规范 (specs/)"""
 
@@ -39,11 +117,13 @@ class SpecManager:
     def load_spec(self, spec_name: str) -> Optional[Spec]:
         """加载规范"""
         spec_path = self.get_spec_path(spec_name)
-        if not spec_path.exists():
+        try:
+            st = spec_path.stat()
+        except FileNotFoundError:
             return None
 
-        content = spec_path.read_text(encoding="utf-8")
-        return self._parse_spec(spec_name, content)
+        cached = _parse_spec_cached(spec_name, str(spec_path), st.st_mtime_ns, st.st_size)
+        return copy.deepcopy(cached)
 
     def save_spec(self, spec: Spec):
         """保存规范"""
@@ -67,50 +147,44 @@ class SpecManager:
         if spec_path.exists():
             spec_path.parent.parent.rmdir()
 
-    def _parse_spec(self, spec_name: str, content: str) -> Spec:
+    @staticmethod
+    def _parse_spec(spec_name: str, content: str) -> Spec:
         """从 Markdown 解析规范"""
-        lines = content.split("\n")
-
         spec = Spec(name=spec_name)
         current_section = None
         current_req = None
-
-        for line in lines:
-            # 解析标题
-            if line.startswith("# "):
-                spec.title = line[2:].strip()
-            elif line.startswith("## Purpose"):
-                current_section = "purpose"
-            elif line.startswith("## Requirements"):
-                current_section = "requirements"
-            elif line.startswith("### Requirement:"):
+        purpose_parts = []
+
+        for m in _SPEC_RE.finditer(content):
+            group = m.lastgroup
+            if group == "title":
+                spec.title = m["title"].strip()
+            elif group == "section":
+                current_section = m["section"].lower()
+            elif group == "req":
                 if current_req:
                     spec.requirements.append(current_req)
-                current_req = Requirement(name=line[16:].strip())
+                current_req = Requirement(name=m["req"].strip())
                 current_section = "requirement"
-            elif line.startswith("#### Scenario:"):
+            elif group == "scenario":
                 if current_req:
-                    scenario = Scenario(when=line[13:].strip())
-                    current_req.scenarios.append(scenario)
-            elif current_section == "purpose" and line.strip():
-                spec.purpose += line.strip() + "\n"
+                    current_req.scenarios.append(Scenario(when=m["scenario"].strip()))
             elif current_section == "requirement" and current_req:
-                if line.strip().startswith(("SHALL", "MUST", "SHOULD", "MAY")):
-                    current_req.description = line.strip()
-                elif line.startswith("- GIVEN"):
-                    if current_req.scenarios:
-                        current_req.scenarios[-1].given = line[7:].strip()
-                elif line.startswith("- WHEN"):
-                    if current_req.scenarios:
-                        current_req.scenarios[-1].when = line[6:].strip()
-                elif line.startswith("- THEN"):
-                    if current_req.scenarios:
-                        current_req.scenarios[-1].then = line[6:].strip()
+                if group == "rfc":
+                    current_req.description = m["rfc"].strip()
+                elif group == "given" and current_req.scenarios:
+                    current_req.scenarios[-1].given = m["given"].strip()
+                elif group == "when" and current_req.scenarios:
+                    current_req.scenarios[-1].when = m["when"].strip()
+                elif group == "then" and current_req.scenarios:
+                    current_req.scenarios[-1].then = m["then"].strip()
+            elif current_section == "purpose":
+                purpose_parts.append(m.group(0).strip())
 
         if current_req:
             spec.requirements.append(current_req)
 
-        spec.purpose = spec.purpose.strip()
+        spec.purpose = "\n".join(purpose_parts)
         return spec
 
 
@@ -131,6 +205,15 @@ class ChangeManager:
         """获取变更目录路径"""
         return self.changes_dir / change_id
 
+    def load_change_meta(self, change_id: str) -> Optional[dict]:
+        """只读取 change.yaml 元数据，不碰提案/任务/增量等大文件"""
+        meta_path = self.get_change_path(change_id) / "change.yaml"
+        try:
+            st = meta_path.stat()
+        except FileNotFoundError:
+            return None
+        return _parse_meta_cached(str(meta_path), st.st_mtime_ns, st.st_size)
+
     def load_change(self, change_id: str) -> Optional[Change]:
         """加载变更"""
         change_path = self.get_change_path(change_id)
@@ -139,15 +222,39 @@ class ChangeManager:
 
         change = Change(id=change_id, title=change_id.replace("-", " ").title())
 
+        # 应用元数据（标题/状态/时间戳随 save_change 写入的 yaml 回读）
+        meta = self.load_change_meta(change_id)
+        if meta:
+            change.title = meta.get("title") or change.title
+            try:
+                change.status = ChangeStatus(meta.get("status"))
+            except ValueError:
+                pass
+            for attr in ("created_at", "updated_at"):
+                try:
+                    setattr(change, attr, datetime.fromisoformat(meta[attr]))
+                except (KeyError, TypeError, ValueError):
+                    pass
+
         # 加载提案
         proposal_path = change_path / "proposal.md"
-        if proposal_path.exists():
-            change.proposal = self._parse_proposal(proposal_path.read_text(encoding="utf-8"))
+        try:
+            st = proposal_path.stat()
+        except FileNotFoundError:
+            pass
+        else:
+            change.proposal = copy.deepcopy(
+                _parse_proposal_cached(str(proposal_path), st.st_mtime_ns, st.st_size))
 
         # 加载任务
         tasks_path = change_path / "tasks.md"
-        if tasks_path.exists():
-            change.tasks = self._parse_tasks(tasks_path.read_text(encoding="utf-8"))
+        try:
+            st = tasks_path.stat()
+        except FileNotFoundError:
+            pass
+        else:
+            change.tasks = list(copy.deepcopy(
+                _parse_tasks_cached(str(tasks_path), st.st_mtime_ns, st.st_size)))
 
         # 加载设计笔记
         design_path = change_path / "design.md"
@@ -164,54 +271,83 @@ class ChangeManager:
     def save_change(self, change: Change):
         """保存变更"""
         change_path = self.get_change_path(change.id)
-        change_path.mkdir(parents=True, exist_ok=True)
         change.updated_at = datetime.now()
 
-        # 保存提案
+        # 先在内存里收集 (路径, 内容)，目录创建和写入各自批量完成
+        writes: list[tuple[Path, str]] = []
+
+        # 提案
         if change.proposal:
-            proposal_path = change_path / "proposal.md"
-            proposal_path.write_text(change.proposal.to_markdown(), encoding="utf-8")
+            writes.append((change_path / "proposal.md", change.proposal.to_markdown()))
 
-        # 保存任务
-        tasks_path = change_path / "tasks.md"
-        tasks_path.write_text(self._format_tasks(change.tasks), encoding="utf-8")
+        # 任务
+        writes.append((change_path / "tasks.md", self._format_tasks(change.tasks)))
 
-        # 保存设计笔记
+        # 设计笔记
         if change.design_notes:
-            design_path = change_path / "design.md"
-            design_path.write_text(change.design_notes, encoding="utf-8")
-
-        # 保存规范增量
-        if change.spec_deltas:
-            for delta in change.spec_deltas:
-                delta_path = change_path / "specs" / delta.spec_name / "spec.md"
-                delta_path.parent.mkdir(parents=True, exist_ok=True)
-                delta_path.write_text(delta.to_markdown(), encoding="utf-8")
-
-        # 保存元数据
-        meta_path = change_path / "change.yaml"
-        with open(meta_path, "w", encoding="utf-8") as f:
-            yaml.dump({
-                "id": change.id,
-                "title": change.title,
-                "status": change.status.value,
-                "created_at": change.created_at.isoformat(),
-                "updated_at": change.updated_at.isoformat()
-            }, f, allow_unicode=True)
+            writes.append((change_path / "design.md", change.design_notes))
+
+        # 规范增量
+        for delta in change.spec_deltas:
+            writes.append((
+                change_path / "specs" / delta.spec_name / "spec.md",
+                delta.to_markdown(),
+            ))
+
+        # 元数据
+        writes.append((change_path / "change.yaml", yaml.dump({
+            "id": change.id,
+            "title": change.title,
+            "status": change.status.value,
+            "created_at": change.created_at.isoformat(),
+            "updated_at": change.updated_at.isoformat()
+        }, Dumper=_YamlDumper, allow_unicode=True, sort_keys=False)))
+
+        # 去重后的父目录各建一次，取代逐文件的 stat+mkdir
+        for parent in {path.parent for path, _ in writes}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        # 原始 fd 单次 write 落盘，跳过 TextIOWrapper 的逐层开销
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        for path, content in writes:
+            fd = os.open(path, flags, 0o644)
+            try:
+                # os.write 允许短写，循环写完整个缓冲区，避免静默截断
+                view = memoryview(content.encode("utf-8"))
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
 
     def list_changes(self, status: Optional[ChangeStatus] = None) -> list[Change]:
-        """列出所有变更"""
+        """列出所有变更
+
+        先只读各变更的 change.yaml 做状态过滤和排序，
+        幸存者才做完整加载（提案/任务/增量解析），惰性过滤省掉落选项的解析成本
+        """
         if not self.changes_dir.exists():
             return []
 
-        changes = []
+        survivors: list[tuple[str, str]] = []
         for d in self.changes_dir.iterdir():
-            if d.is_dir() and not d.name.startswith("."):
-                change = self.load_change(d.name)
-                if change and (status is None or change.status == status):
-                    changes.append(change)
+            if not (d.is_dir() and not d.name.startswith(".")):
+                continue
+            meta = self.load_change_meta(d.name) or {}
+            if status is not None:
+                meta_status = meta.get("status", ChangeStatus.DRAFT.value)
+                if meta_status != status.value:
+                    continue
+            survivors.append((d.name, meta.get("created_at") or ""))
+
+        # ISO 时间戳按字典序即时间序，直接对元数据排序
+        survivors.sort(key=lambda item: item[1], reverse=True)
 
-        return sorted(changes, key=lambda c: c.created_at, reverse=True)
+        changes = []
+        for change_id, _ in survivors:
+            change = self.load_change(change_id)
+            if change:
+                changes.append(change)
+        return changes
 
     def delete_change(self, change_id: str):
         """删除变更"""
@@ -235,19 +371,20 @@ class ChangeManager:
             if delta.delta_type == DeltaType.ADDED:
                 spec.requirements.extend(delta.requirements)
             elif delta.delta_type == DeltaType.MODIFIED:
-                # 替换同名需求
+                # 替换同名需求：名称→下标索引一次建好，O(1) 查找取代逐项线性扫描
+                index = {r.name: i for i, r in enumerate(spec.requirements)}
                 for new_req in delta.requirements:
-                    for i, existing_req in enumerate(spec.requirements):
-                        if existing_req.name == new_req.name:
-                            spec.requirements[i] = new_req
-                            break
+                    i = index.get(new_req.name)
+                    if i is not None:
+                        spec.requirements[i] = new_req
                     else:
+                        index[new_req.name] = len(spec.requirements)
                         spec.requirements.append(new_req)
             elif delta.delta_type == DeltaType.REMOVED:
-                # 移除指定需求
+                # 移除指定需求（名称集合提出推导式，只构建一次）
+                removed = {req.name for req in delta.requirements}
                 spec.requirements = [
-                    r for r in spec.requirements
-                    if r.name not in {req.name for req in delta.requirements}
+                    r for r in spec.requirements if r.name not in removed
                 ]
 
             spec_manager.save_spec(spec)
@@ -260,55 +397,41 @@ class ChangeManager:
         change.status = ChangeStatus.ARCHIVED
         return change
 
-    def _parse_proposal(self, content: str) -> Proposal:
+    @staticmethod
+    def _parse_proposal(content: str) -> Proposal:
         """解析提案"""
-        lines = content.split("\n")
         proposal = Proposal(title="", description="")
+        sections = {"description": [], "motivation": [], "impact": []}
 
         current_section = None
-        for line in lines:
-            if line.startswith("## "):
-                current_section = line[3:].lower()
-            elif current_section == "description" and line.strip():
-                proposal.description += line.strip() + "\n"
-            elif current_section == "motivation" and line.strip():
-                proposal.motivation += line.strip() + "\n"
-            elif current_section == "impact" and line.strip():
-                proposal.impact += line.strip() + "\n"
-            elif line.startswith("# ") and not proposal.title:
-                proposal.title = line[2:].strip()
-
-        proposal.description = proposal.description.strip()
-        proposal.motivation = proposal.motivation.strip()
-        proposal.impact = proposal.impact.strip()
+        for m in _PROPOSAL_RE.finditer(content):
+            if m.lastgroup == "section":
+                current_section = m["section"].lower()
+            else:
+                line = m.group(0)
+                parts = sections.get(current_section)
+                if parts is not None:
+                    parts.append(line.strip())
+                elif line.startswith("# ") and not proposal.title:
+                    proposal.title = line[2:].strip()
+
+        proposal.description = "\n".join(sections["description"])
+        proposal.motivation = "\n".join(sections["motivation"])
+        proposal.impact = "\n".join(sections["impact"])
 
         return proposal
 
-    def _parse_tasks(self, content: str) -> list[Task]:
+    @staticmethod
+    def _parse_tasks(content: str) -> list[Task]:
         """解析任务"""
-        tasks = []
-        for line in content.split("\n"):
-            if line.strip().startswith("- [") or line.strip().startswith("- [~") or line.strip().startswith("- [x]"):
-                # 解析任务行: - [ ] **1.1: Task Title**
-                status_str = line[3:5]
-                status = {
-                    "[ ]": TaskStatus.PENDING,
-                    "[~": TaskStatus.IN_PROGRESS,
-                    "[x]": TaskStatus.COMPLETED,
-                    "[_]": TaskStatus.SKIPPED,
-                }.get(status_str, TaskStatus.PENDING)
-
-                rest = line[5:].strip()
-
-                # 提取 ID 和标题
-                if rest.startswith("**"):
-                    parts = rest.split(":", 1)
-                    if len(parts) == 2:
-                        task_id = parts[0][2:].strip()
-                        title = parts[1].split("*", 1)[0].strip()
-                        tasks.append(Task(id=task_id, title=title, status=status))
-
-        return tasks
+        return [
+            Task(
+                id=m["id"].strip(),
+                title=m["title"].strip(),
+                status=_TASK_STATUS[m["st"]],
+            )
+            for m in _TASK_RE.finditer(content)
+        ]
 
     def _format_tasks(self, tasks: list[Task]) -> str:
         """格式化任务为 Markdown"""